@@ -54,9 +54,12 @@ if ip link show eth1 &>/dev/null; then
         sleep 1
     done
 
-    # Add routes for VPC subnets via OVN gateway
-    ip route add 10.0.0.0/16 via 192.168.100.1 dev eth1 2>/dev/null || true
-    ip route add 10.1.0.0/16 via 192.168.100.1 dev eth1 2>/dev/null || true
+    # Add routes for VPC subnets via OVN gateway (one ip process; -force
+    # keeps going past routes that already exist)
+    ip -force -batch - 2>/dev/null <<ROUTES || true
+route add 10.0.0.0/16 via 192.168.100.1 dev eth1
+route add 10.1.0.0/16 via 192.168.100.1 dev eth1
+ROUTES
     echo "Routes added for VPC subnets"
 fi
 
@@ -5,12 +5,22 @@ All network configuration is in docker-compose.yml
 """
 
 import argparse
+import fcntl
+import functools
+import io
+import json
 import logging
 import os
+import re
+import shlex
+import shutil
+import socket
+import struct
 import subprocess
 import sys
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -22,22 +32,664 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SIOCGIFADDR = 0x8915
+SIOCGIFINDEX = 0x8933
+CLONE_NEWNET = 0x40000000
+
+# Prefix for commands that need root. make already runs the orchestrator
+# under sudo, so as root the commands run directly without a sudo exec each
+SUDO = [] if os.geteuid() == 0 else ["sudo"]
+
+# Docker network plugin built from ovs-container-network/
+PLUGIN_NAME = "ovs-container-network:latest"
+
+# OVN Northbound/Southbound databases, as reached from the host over transit-overlay
+OVN_NB_REMOTE = "tcp:172.30.0.5:6641"
+OVN_SB_REMOTE = "tcp:172.30.0.5:6642"
+
+# Local Open vSwitch database on the host
+OVS_DB_REMOTE = "unix:/var/run/openvswitch/db.sock"
+
+# Traffic generator containers and the VPC web server each one probes
+TRAFFIC_GENERATORS = ("traffic-gen-a", "traffic-gen-b")
+TRAFFIC_TARGETS = {
+    "traffic-gen-a": ("10.0.1.10", "vpc-a-web"),
+    "traffic-gen-b": ("10.1.1.10", "vpc-b-web"),
+}
+
+# Expected performance of each traffic-gen.py mode
+TRAFFIC_SPECS = {
+    'standard': {
+        'bandwidth': '100 Mbps',
+        'pps': '1000 packets/sec',
+        'connections': '20 concurrent',
+        'cpu': '50% limit'
+    },
+    'high': {
+        'bandwidth': '500 Mbps',
+        'pps': '5000 packets/sec',
+        'connections': '40 concurrent',
+        'cpu': '70% limit'
+    },
+    'chaos': {
+        'bandwidth': '1000 Mbps',
+        'pps': '10000 packets/sec',
+        'connections': '60 concurrent',
+        'cpu': '90% limit'
+    }
+}
+TRAFFIC_BANDWIDTH_MBPS = {
+    'standard': 100,   # 100 Mbps
+    'high': 500,       # 500 Mbps
+    'chaos': 1000      # 1000 Mbps (1 Gbps)
+}
+
+# OVS exporter release for this host's architecture, resolved once at import
+# (None if the exporter is not published for this machine type)
+EXPORTER_ARCHES = {"aarch64": "arm64", "arm64": "arm64", "x86_64": "amd64", "amd64": "amd64"}
+EXPORTER_ARCH = EXPORTER_ARCHES.get(os.uname().machine)
+OVS_EXPORTER_VERSION = "2.3.1"
+OVS_EXPORTER_RELEASE = f"ovs-exporter-{OVS_EXPORTER_VERSION}.linux-{EXPORTER_ARCH}"
+OVS_EXPORTER_URL = ("https://github.com/Liquescent-Development/ovs_exporter/releases/download/"
+                    f"v{OVS_EXPORTER_VERSION}/{OVS_EXPORTER_RELEASE}.tar.gz")
+# SHA-256 of each release tarball by architecture. Setup refuses a download
+# that doesn't match a digest listed here; for an architecture with no
+# digest it logs the one it got and installs unverified.
+OVS_EXPORTER_SHA256 = {}
+
+# Stable chassis system-id for the host, shared by OVS and the OVS exporter
+OVS_SYSTEM_ID = "chassis-host"
+OVS_SYSTEM_ID_CONF = f"{OVS_SYSTEM_ID}\n".encode()  # /etc/openvswitch/system-id.conf
+
+# systemd service for the OVS exporter (it reads the system-id from the OVS database)
+OVS_EXPORTER_UNIT = b"""[Unit]
+Description=OVS Exporter for Prometheus
+After=network.target openvswitch-switch.service
+
+[Service]
+Type=simple
+User=root
+ExecStart=/usr/local/bin/ovs-exporter \\
+  --web.listen-address=0.0.0.0:9475 \\
+  --web.telemetry-path=/metrics \\
+  --log.level=info
+Restart=always
+RestartSec=10
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+# Node exporter binary, as installed by hand or by the prometheus-node-exporter package
+NODE_EXPORTER_BINARIES = ("/usr/local/bin/node_exporter", "/usr/bin/prometheus-node-exporter")
+
+# Container groups used for chaos targeting
+INFRASTRUCTURE_CONTAINERS = frozenset({'ovn-central', 'nat-gateway', 'ovs-vpc-a', 'ovs-vpc-b'})
+MONITORING_CONTAINERS = frozenset({'prometheus', 'grafana', 'influxdb', 'telegraf'})
+
+
+def interface_ipv4(ifname: str) -> str:
+    """Return the IPv4 address of a host interface, or "" if it has none
+
+    Asks the kernel directly with the SIOCGIFADDR ioctl instead of forking
+    `ip addr show` and parsing its output.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            ifreq = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, struct.pack("256s", ifname.encode()[:15]))
+        except OSError:
+            return ""
+    return socket.inet_ntoa(ifreq[20:24])
+
+
+def _setns_net(fd: int):
+    """Move the calling thread into the network namespace open at `fd`"""
+    if hasattr(os, "setns"):  # Python 3.12+
+        os.setns(fd, CLONE_NEWNET)
+    else:
+        import ctypes
+        if ctypes.CDLL(None, use_errno=True).setns(fd, CLONE_NEWNET) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """RFC 1071 internet checksum"""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def netns_socket(pid: str, family: int, sock_type: int, proto: int = 0) -> socket.socket:
+    """Create a socket in the network namespace of process `pid`
+
+    The socket stays bound to that namespace after the calling thread has
+    switched back, so it can be used from this process like any other
+    socket, with no `docker exec` or nsenter. Raises OSError if the
+    namespace can't be entered (not root, no setns).
+    """
+    own_ns = os.open("/proc/thread-self/ns/net", os.O_RDONLY)
+    try:
+        target_ns = os.open(f"/proc/{pid}/ns/net", os.O_RDONLY)
+        try:
+            _setns_net(target_ns)
+            try:
+                return socket.socket(family, sock_type, proto)
+            finally:
+                _setns_net(own_ns)
+        finally:
+            os.close(target_ns)
+    finally:
+        os.close(own_ns)
+
+
+def netns_http_get(pid: str, port: int, path: str, timeout: float = 2):
+    """GET http://localhost:`port``path` as seen from the namespace of `pid`
+
+    Returns the response body ("" on any HTTP or connection failure), or
+    None if the namespace can't be entered.
+    """
+    try:
+        sock = netns_socket(pid, socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    response = b""
+    with sock:
+        try:
+            sock.settimeout(timeout)
+            sock.connect(("127.0.0.1", port))
+            sock.sendall(f"GET {path} HTTP/1.0\r\nHost: localhost\r\n\r\n".encode())
+            while chunk := sock.recv(65536):
+                response += chunk
+        except OSError:
+            return ""
+    header, _, body = response.partition(b"\r\n\r\n")
+    if header.split(b" ", 2)[1:2] != [b"200"]:
+        return ""
+    return body.decode("utf-8", "replace")
+
+
+def netns_has_interface(pid: str, ifname: str):
+    """Return whether interface `ifname` exists in the namespace of `pid`
+
+    Resolves the name with the SIOCGIFINDEX ioctl on a socket created in
+    that namespace, instead of `nsenter ... ip link show`. Returns None if
+    the namespace can't be entered.
+    """
+    try:
+        sock = netns_socket(pid, socket.AF_INET, socket.SOCK_DGRAM)
+    except OSError:
+        return None
+    with sock:
+        try:
+            fcntl.ioctl(sock.fileno(), SIOCGIFINDEX, struct.pack("256s", ifname.encode()[:15]))
+        except OSError:
+            return False
+    return True
+
+
+def icmp_ping(pid: str, address: str, timeout: float = 1):
+    """Send one ICMP echo to `address` from the network namespace of `pid`
+
+    Opens a raw socket inside the container's namespace and talks ICMP
+    from this process, instead of `docker exec <container> ping`. Returns
+    True/False for reply/no reply, or None if the namespace can't be
+    entered (not root, no setns) so callers can fall back to ping.
+    """
+    try:
+        sock = netns_socket(pid, socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    except OSError:
+        return None
+
+    ident = os.getpid() & 0xFFFF
+    payload = b"ovs-container-lab"
+    checksum = _icmp_checksum(struct.pack("!BBHHH", 8, 0, 0, ident, 1) + payload)
+    deadline = time.monotonic() + timeout
+    with sock:
+        try:
+            sock.sendto(struct.pack("!BBHHH", 8, 0, checksum, ident, 1) + payload, (address, 0))
+            while True:
+                sock.settimeout(max(deadline - time.monotonic(), 0))
+                data, (source, _) = sock.recvfrom(1024)
+                header = (data[0] & 0x0F) * 4  # Raw ICMP sockets get the IP header too
+                icmp_type, _, _, reply_ident, _ = struct.unpack("!BBHHH", data[header:header + 8])
+                if icmp_type == 0 and reply_ident == ident and source == address:
+                    return True
+        except OSError:  # Includes socket.timeout
+            return False
+
+
+@functools.lru_cache(maxsize=None)
+def docker_client():
+    """Return a Docker SDK client shared by the whole run, or None
+
+    Requests go over one keep-alive connection to the Docker socket instead
+    of forking the docker CLI for each query. None means docker-py is not
+    installed or the daemon is unreachable; callers then use the CLI.
+    """
+    try:
+        import docker
+    except ImportError:  # docker-py is optional
+        return None
+    try:
+        client = docker.from_env()
+        client.ping()
+        return client
+    except docker.errors.DockerException:
+        return None
+
+
+def container_pid(container: str) -> str:
+    """Return the PID of a container's init process, or "" if it isn't running"""
+    client = docker_client()
+    if client is not None:
+        from docker.errors import DockerException
+        try:
+            pid = str(client.api.inspect_container(container)["State"]["Pid"])
+            return pid if pid != "0" else ""
+        except DockerException:
+            return ""
+    result = subprocess.run(["docker", "inspect", "-f", "{{.State.Pid}}", container],
+                            capture_output=True, text=True)
+    pid = result.stdout.strip()
+    return pid if result.returncode == 0 and pid != "0" else ""
+
+
+def container_ping(container: str, address: str, pid: str = None) -> bool:
+    """Ping `address` once from inside `container`
+
+    Pass `pid` (see container_pid) when pinging repeatedly to skip the
+    lookup. Uses icmp_ping and only falls back to `docker exec ... ping`
+    when the container's namespace can't be entered.
+    """
+    if pid is None:
+        pid = container_pid(container)
+    reachable = icmp_ping(pid, address) if pid else None
+    if reachable is None:
+        cmd = ["ping", "-c", "1", "-W", "1", address]
+        client = docker_client()
+        if client is not None:
+            from docker.errors import DockerException
+            try:
+                return client.containers.get(container).exec_run(cmd).exit_code == 0
+            except DockerException:
+                return False
+        result = subprocess.run(["docker", "exec", container] + cmd,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        reachable = result.returncode == 0
+    return reachable
+
+
+def ovsdb_transact(remote: str, database: str, operations: list, timeout: float = 5) -> list:
+    """Run one OVSDB "transact" request over JSON-RPC and return its results
+
+    Talks to ovsdb-server directly (RFC 7047), so reading several tables
+    costs one socket round-trip instead of a docker exec plus a ctl client.
+    `remote` uses the OVS syntax ("tcp:IP:PORT" or "unix:PATH"). Raises
+    OSError if the server is unreachable or rejects the request.
+    """
+    kind, _, address = remote.partition(":")
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        target = address
+    else:
+        host, _, port = address.rpartition(":")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        target = (host, int(port))
+
+    request = {"method": "transact", "params": [database] + operations, "id": 0}
+    decoder = json.JSONDecoder()
+    buf = b""
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(target)
+        sock.sendall(json.dumps(request).encode())
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionError(f"{remote} closed the connection")
+            buf += chunk
+            try:
+                reply, end = decoder.raw_decode(buf.decode())
+            except ValueError:
+                continue  # Incomplete message, keep reading
+            if reply.get("id") == 0 and "result" in reply:
+                break
+            # Not our reply (e.g. an inactivity echo); drop it and keep reading
+            buf = buf.decode()[end:].lstrip().encode()
+
+    if reply.get("error"):
+        raise OSError(f"OVSDB {database} transact failed: {reply['error']}")
+    return reply["result"]
+
+
+def wait_until(predicate, timeout: float = 10, interval: float = 0.05):
+    """Poll `predicate` with exponential backoff until it returns a truthy value
+
+    Returns that value, or the last falsy result once `timeout` seconds
+    have passed. Use instead of a fixed sleep before checking a state.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        value = predicate()
+        if value or time.monotonic() >= deadline:
+            return value
+        time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+        interval *= 1.5
+
+
+def write_file(path: str, data: bytes, mode: int = 0o644) -> bool:
+    """Replace the contents of `path` with `data` using a single write
+
+    Leaves the file alone if it already holds `data`. Returns whether it
+    was written, so callers can skip reloading whatever reads it. When not
+    running as root the write goes through `sudo install` instead.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass  # Missing or unreadable, write it
+    if SUDO:
+        subprocess.run([*SUDO, "install", "-m", f"{mode:o}", "/dev/stdin", path], input=data, check=True)
+        return True
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
+
+
+class HashingReader:
+    """File-like wrapper that feeds everything read through it into `hash`"""
+
+    def __init__(self, raw, hash):
+        self.raw = raw
+        self.hash = hash
+
+    def read(self, size=-1) -> bytes:
+        data = self.raw.read(size)
+        self.hash.update(data)
+        return data
+
+
+def hosts_file_has(name: str) -> bool:
+    """Return True if `name` appears in /etc/hosts"""
+    try:
+        with open("/etc/hosts") as f:
+            return name in f.read()
+    except OSError:
+        return False
+
+
+def tcp_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Return True if something is accepting TCP connections on host:port"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def docker_plugins() -> dict:
+    """Return {plugin name: enabled} for all installed Docker plugins
+
+    Raises subprocess.CalledProcessError if the plugin list is unavailable.
+    """
+    client = docker_client()
+    if client is not None:
+        from docker.errors import DockerException
+        try:
+            return {plugin["Name"]: plugin["Enabled"] for plugin in client.api.plugins()}
+        except DockerException:
+            pass  # Let the CLI report the failure
+    result = subprocess.run(["docker", "plugin", "ls", "--format", "{{.Name}}|{{.Enabled}}"],
+                            capture_output=True, text=True, check=True)
+    plugins = {}
+    for line in result.stdout.split():
+        name, _, enabled = line.partition('|')
+        plugins[name] = enabled == "true"
+    return plugins
+
+
+def running_containers(label: str = None) -> set:
+    """Return the names of all running containers from a single `docker ps`
+
+    Pass `label` to only list containers carrying that label.
+    """
+    client = docker_client()
+    if client is not None:
+        from docker.errors import DockerException
+        try:
+            # The low-level list is one API call; containers.list() inspects each one
+            filters = {"label": label} if label else None
+            return {name.lstrip("/") for container in client.api.containers(filters=filters)
+                    for name in container["Names"]}
+        except DockerException:
+            return set()
+    cmd = ["docker", "ps", "--format", "{{.Names}}"]
+    if label:
+        cmd += ["--filter", f"label={label}"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return set(result.stdout.split())
+
+
+def _ovn_ctl_argv(tool: str, daemon_env: str) -> list:
+    """Build the fixed argv prefix that runs an OVN ctl utility in ovn-central
+
+    start-ovn.sh leaves the control socket of a detached ovn-nbctl/ovn-sbctl
+    in /var/run/ovn/<tool>.daemon; pointing the client at it skips the
+    per-invocation database snapshot. Falls back to a standalone client if
+    the daemon is not running. Command arguments are appended to the prefix.
+    """
+    # Only shell builtins before the exec, so no extra process per call
+    script = (f'{{ read -r d < /var/run/ovn/{tool}.daemon; }} 2>/dev/null && [ -S "$d" ] && '
+              f'export {daemon_env}="$d"; exec {tool} "$@"')
+    return ["docker", "exec", "ovn-central", "sh", "-c", script, tool]
+
+
+# Built once; every run_nbctl/run_sbctl call only appends its own arguments
+NBCTL_ARGV = _ovn_ctl_argv("ovn-nbctl", "OVN_NB_DAEMON")
+SBCTL_ARGV = _ovn_ctl_argv("ovn-sbctl", "OVN_SB_DAEMON")
+
+
+def run_nbctl(args: list) -> subprocess.CompletedProcess:
+    """Run ovn-nbctl inside the ovn-central container
+
+    Several commands can be chained in one call (and one NB transaction)
+    by separating them with "--".
+    """
+    return subprocess.run(NBCTL_ARGV + args, capture_output=True, text=True)
+
+
+def run_sbctl(args: list) -> subprocess.CompletedProcess:
+    """Run ovn-sbctl inside the ovn-central container"""
+    return subprocess.run(SBCTL_ARGV + args, capture_output=True, text=True)
+
+
+class ThreadLocalOutput:
+    """sys.stdout stand-in that lets worker threads buffer their own prints
+
+    Output from a function run through capture() goes to a per-thread
+    buffer; everything else passes straight through to `stream`.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, func):
+        """Call func() with this thread's output buffered; return (output, result)"""
+        self.local.buffer = io.StringIO()
+        try:
+            result = func()
+            return self.local.buffer.getvalue(), result
+        finally:
+            self.local.buffer = None
+
+
+class ContainerShell:
+    """Long-lived shell inside a container for running many short commands
+
+    Every `docker exec` pays for a CLI start plus a new exec instance in the
+    daemon. Keeping one `docker exec -i <container> sh` open and writing
+    commands to its stdin turns repeated probes into a pipe round-trip.
+    """
+
+    def __init__(self, container: str):
+        self.container = container
+        self._marker = f"__ovs_lab_{os.urandom(8).hex()}__"
+        self._proc = None
+
+    def run(self, cmd: list) -> subprocess.CompletedProcess:
+        """Run a command in the container shell (stderr is discarded)"""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["docker", "exec", "-i", self.container, "sh"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True
+            )
+
+        # The extra echo guarantees the marker starts on its own line
+        try:
+            self._proc.stdin.write(f"{shlex.join(cmd)} </dev/null 2>/dev/null; "
+                                   f"rc=$?; echo; echo {self._marker} $rc\n")
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            self.close()
+            return subprocess.CompletedProcess(cmd, 1, "", "")
+
+        lines = []
+        for line in self._proc.stdout:
+            if line.startswith(self._marker):
+                returncode = int(line.split()[1])
+                return subprocess.CompletedProcess(cmd, returncode, "".join(lines)[:-1], "")
+            lines.append(line)
+
+        # Shell went away (container stopped); respawn on the next call
+        self.close()
+        return subprocess.CompletedProcess(cmd, 1, "".join(lines), "")
+
+    def close(self):
+        """Terminate the container shell"""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            self._proc.wait()
+            self._proc = None
+
+
+class SystemdClient:
+    """Minimal systemd control, over D-Bus via pystemd when available
+
+    Each operation is then a method call on one bus connection instead of
+    forking `sudo systemctl`; without pystemd (or root) it falls back to
+    systemctl. Methods return True on success, with any failure message
+    left in `error`.
+    """
+
+    def __init__(self):
+        self.error = ""
+        self.manager = None
+        if os.geteuid() != 0:
+            return
+        try:
+            from pystemd.dbusexc import DBusBaseError
+            from pystemd.systemd1 import Manager, Unit
+        except ImportError:  # pystemd is optional
+            return
+        self._error_type, self._unit_type = DBusBaseError, Unit
+        try:
+            self.manager = Manager()
+            self.manager.load()
+        except DBusBaseError:  # No system bus to talk to
+            self.manager = None
+
+    @staticmethod
+    def _unit_file(unit: str) -> bytes:
+        return (unit if "." in unit else f"{unit}.service").encode()
+
+    def _call(self, method: str, *args, systemctl: list) -> bool:
+        self.error = ""
+        if self.manager is not None:
+            try:
+                getattr(self.manager.Manager, method)(*args)
+                return True
+            except self._error_type as e:
+                self.error = str(e)
+                return False
+        result = subprocess.run([*SUDO, "systemctl"] + systemctl, capture_output=True, text=True)
+        self.error = result.stderr.strip()
+        return result.returncode == 0
+
+    def reload(self) -> bool:
+        return self._call("Reload", systemctl=["daemon-reload"])
+
+    def enable(self, unit: str) -> bool:
+        return self._call("EnableUnitFiles", [self._unit_file(unit)], False, True,
+                          systemctl=["enable", unit])
+
+    def restart(self, unit: str) -> bool:
+        return self._call("RestartUnit", self._unit_file(unit), b"replace",
+                          systemctl=["restart", unit])
+
+    def reload_and_restart(self, unit: str, enable: bool = False, reload: bool = True) -> bool:
+        """daemon-reload, optionally enable `unit`, then restart it
+
+        Pass reload=False when no unit file changed. Without D-Bus the steps
+        run in one shell rather than one `sudo systemctl` each.
+        """
+        if self.manager is not None:
+            return ((not reload or self.reload()) and (not enable or self.enable(unit))
+                    and self.restart(unit))
+        steps = ["systemctl daemon-reload"] if reload else []
+        if enable:
+            steps.append('systemctl enable "$1"')
+        steps.append('systemctl restart "$1"')
+        result = subprocess.run([*SUDO, "sh", "-c", " && ".join(steps), "systemd", unit],
+                                capture_output=True, text=True)
+        self.error = result.stderr.strip()
+        return result.returncode == 0
+
+    def is_active(self, unit: str) -> bool:
+        if self.manager is not None:
+            try:
+                systemd_unit = self._unit_type(self._unit_file(unit))
+                systemd_unit.load()
+                return systemd_unit.Unit.ActiveState == b"active"
+            except self._error_type:
+                return False
+        result = subprocess.run(["systemctl", "is-active", unit], capture_output=True, text=True)
+        return result.stdout.strip() == "active"
+
+
 class DockerNetworkPlugin:
     """Manages the OVS Container Network Docker plugin"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.plugin_name = "ovs-container-network:latest"
+        self.plugin_name = PLUGIN_NAME
         self.plugin_dir = "/home/lima/code/ovs-container-lab/ovs-container-network"
 
     def is_installed(self) -> bool:
         """Check if the plugin is installed and enabled"""
         try:
-            result = subprocess.run(
-                ["docker", "plugin", "ls"],
-                capture_output=True, text=True, check=True
-            )
-            return self.plugin_name in result.stdout and "true" in result.stdout
+            return docker_plugins().get(self.plugin_name, False)
         except subprocess.CalledProcessError:
             return False
 
@@ -70,7 +722,7 @@ class DockerNetworkPlugin:
 
         # First, create a temporary container to export the rootfs
         build_dir = "/tmp/ovs-container-network-build"
-        subprocess.run(["rm", "-rf", build_dir], check=False)
+        shutil.rmtree(build_dir, ignore_errors=True)
         os.makedirs(build_dir, exist_ok=True)
 
         # Export the image to rootfs
@@ -80,34 +732,38 @@ class DockerNetworkPlugin:
             capture_output=True, text=True
         ).stdout.strip()
 
-        result = subprocess.run(
-            ["docker", "export", container_id, "-o", f"{build_dir}/rootfs.tar"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            logger.error(f"Failed to export container: {result.stderr}")
+        # Pipe the export straight into tar; the data moves between the two
+        # processes through the kernel instead of via a rootfs.tar on disk
+        os.makedirs(f"{build_dir}/rootfs", exist_ok=True)
+        export = subprocess.Popen(["docker", "export", container_id],
+                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        untar = subprocess.Popen(["tar", "-xf", "-", "-C", f"{build_dir}/rootfs"],
+                                 stdin=export.stdout, stderr=subprocess.PIPE)
+        export.stdout.close()  # tar holds the only read end now
+        _, untar_error = untar.communicate()
+        _, export_error = export.communicate()
+        if export.returncode != 0 or untar.returncode != 0:
+            logger.error(f"Failed to export container: {(export_error or untar_error).decode()}")
             subprocess.run(["docker", "rm", container_id], check=False)
+            shutil.rmtree(build_dir, ignore_errors=True)
             return False
 
-        # Extract the rootfs
-        os.makedirs(f"{build_dir}/rootfs", exist_ok=True)
-        subprocess.run(["tar", "-xf", f"{build_dir}/rootfs.tar", "-C", f"{build_dir}/rootfs"], check=True)
-
         # Clean up temporary container
         subprocess.run(["docker", "rm", container_id], check=False)
 
         # Copy config.json
-        subprocess.run(["cp", "config.json", f"{build_dir}/"], check=True)
+        shutil.copy2("config.json", build_dir)
 
         # Remove existing plugin if present
         subprocess.run(["docker", "plugin", "rm", "-f", self.plugin_name],
-                      capture_output=True, check=False)
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
 
         # Create the plugin
         logger.info("Creating Docker plugin...")
-        os.chdir(build_dir)
-        result = subprocess.run(["docker", "plugin", "create", self.plugin_name, "."],
+        result = subprocess.run(["docker", "plugin", "create", self.plugin_name, build_dir],
                               capture_output=True, text=True)
+        # Docker keeps its own copy of the rootfs, so the build directory is done with
+        shutil.rmtree(build_dir, ignore_errors=True)
         if result.returncode != 0:
             logger.error(f"Failed to create plugin: {result.stderr}")
             return False
@@ -119,12 +775,9 @@ class DockerNetworkPlugin:
             logger.error(f"Failed to enable plugin: {result.stderr}")
             return False
 
-        # Create br-int if it doesn't exist
-        result = subprocess.run(["sudo", "ovs-vsctl", "br-exists", "br-int"],
-                              capture_output=True, check=False)
-        if result.returncode != 0:
-            logger.info("Creating OVS integration bridge (br-int)...")
-            subprocess.run(["sudo", "ovs-vsctl", "add-br", "br-int"], check=True)
+        # Create br-int if it doesn't exist (--may-exist makes add-br idempotent)
+        logger.info("Ensuring OVS integration bridge (br-int) exists...")
+        subprocess.run([*SUDO, "ovs-vsctl", "--may-exist", "add-br", "br-int"], check=True)
 
         logger.info("✅ OVS Container Network Plugin installed successfully!")
         return True
@@ -135,7 +788,7 @@ class DockerNetworkPlugin:
 
         # First disable the plugin
         subprocess.run(["docker", "plugin", "disable", self.plugin_name],
-                      capture_output=True, check=False)
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
 
         # Then remove it
         result = subprocess.run(["docker", "plugin", "rm", self.plugin_name],
@@ -156,6 +809,9 @@ class DockerNetworkPlugin:
 class MonitoringManager:
     """Manages monitoring exporters"""
 
+    def __init__(self):
+        self.systemd = SystemdClient()
+
     def restart_exporters(self) -> bool:
         """Restart monitoring exporters"""
         print("\n🔄 Restarting Monitoring Exporters")
@@ -163,28 +819,23 @@ class MonitoringManager:
 
         # First ensure OVS has the correct stable system-id
         print("\n🔧 Ensuring stable OVS system-id...")
-        subprocess.run(["sudo", "ovs-vsctl", "set", "open-vswitch", ".",
-                       "external_ids:system-id=chassis-host"],
-                      capture_output=True)
-        print("   ✓ Set system-id to 'chassis-host'")
+        subprocess.run([*SUDO, "ovs-vsctl", "--no-wait", "set", "open-vswitch", ".",
+                       f"external_ids:system-id={OVS_SYSTEM_ID}"],
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        print(f"   ✓ Set system-id to '{OVS_SYSTEM_ID}'")
 
         # Restart OVS exporter
         print("\n📊 OVS Exporter:")
-        result = subprocess.run(["sudo", "systemctl", "restart", "ovs-exporter"],
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+        if self.systemd.restart("ovs-exporter"):
             print("   ✓ Service restarted")
-            # Give it a moment to start
-            time.sleep(2)
-            # Check if it's actually running
-            status = subprocess.run(["sudo", "systemctl", "is-active", "ovs-exporter"],
-                                  capture_output=True, text=True)
-            if status.stdout.strip() == "active":
+            # Wait until it actually serves metrics rather than sleeping a
+            # fixed amount (a simple unit is "active" as soon as it forks)
+            if wait_until(lambda: tcp_port_open("localhost", 9475), timeout=5):
                 print("   ✓ Service is now active")
             else:
                 print("   ❌ Service failed to start")
                 print("   Checking logs...")
-                logs = subprocess.run(["sudo", "journalctl", "-u", "ovs-exporter", "-n", "10", "--no-pager"],
+                logs = subprocess.run([*SUDO, "journalctl", "-u", "ovs-exporter", "-n", "10", "--no-pager"],
                                     capture_output=True, text=True)
                 print("   Recent logs:")
                 for line in logs.stdout.split('\n')[-5:]:
@@ -192,19 +843,15 @@ class MonitoringManager:
                         print(f"      {line}")
         else:
             print("   ❌ Failed to restart service")
-            print(f"   Error: {result.stderr}")
+            print(f"   Error: {self.systemd.error}")
 
         # Restart node exporter
         print("\n📊 Node Exporter:")
-        result = subprocess.run(["sudo", "systemctl", "restart", "prometheus-node-exporter"],
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+        if self.systemd.restart("prometheus-node-exporter"):
             print("   ✓ Service restarted")
         else:
             # Try alternative name
-            result = subprocess.run(["sudo", "systemctl", "restart", "node_exporter"],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            if self.systemd.restart("node_exporter"):
                 print("   ✓ Service restarted")
             else:
                 print("   ⚠️  Could not restart node exporter")
@@ -219,16 +866,23 @@ class MonitoringManager:
 
         # Check OVS exporter
         print("\n📊 OVS Exporter:")
-        result = subprocess.run(["sudo", "systemctl", "status", "ovs-exporter", "--no-pager"],
-                              capture_output=True, text=True)
-        if "active (running)" in result.stdout:
+        if self.systemd.is_active("ovs-exporter"):
             print("   ✓ Service is running")
-            # Try to curl metrics
-            curl_result = subprocess.run(["curl", "-s", "http://localhost:9475/metrics"],
-                                        capture_output=True, text=True)
-            if curl_result.returncode == 0 and "ovs_" in curl_result.stdout:
+            # Try to fetch metrics. http.client talks to the port directly,
+            # without urllib's opener and proxy environment handling
+            import http.client
+            conn = http.client.HTTPConnection("127.0.0.1", 9475, timeout=2)
+            try:
+                conn.request("GET", "/metrics")
+                response = conn.getresponse()
+                metrics = response.read().decode("utf-8", "replace") if response.status == 200 else ""
+            except (OSError, http.client.HTTPException):
+                metrics = ""
+            finally:
+                conn.close()
+            if "ovs_" in metrics:
                 print("   ✓ Metrics endpoint is responding")
-                print(f"   📈 Sample metrics: {len(curl_result.stdout.split(chr(10)))} lines")
+                print(f"   📈 Sample metrics: {len(metrics.split(chr(10)))} lines")
             else:
                 print("   ❌ Metrics endpoint not responding")
         else:
@@ -237,49 +891,47 @@ class MonitoringManager:
 
         # Check OVN exporter (runs in container)
         print("\n📊 OVN Exporter:")
-        # Check if ovn-central container is running
-        result = subprocess.run(["docker", "ps", "--filter", "name=ovn-central", "--format", "{{.Names}}"],
-                              capture_output=True, text=True)
-        if "ovn-central" in result.stdout:
+        # Check if ovn-central container is running; its PID is looked up
+        # once and reused to reach the container's namespace below
+        ovn_pid = container_pid("ovn-central")
+        if ovn_pid:
+            # One shell session serves the probes inside the container
+            ovn_shell = ContainerShell("ovn-central")
             # Check if exporter process is running
-            result = subprocess.run(["docker", "exec", "ovn-central", "ps", "aux"],
-                                  capture_output=True, text=True)
+            result = ovn_shell.run(["ps", "aux"])
             if "ovn-exporter" in result.stdout:
                 print("   ✓ Service is running in ovn-central container")
-                # Try to curl metrics
-                curl_result = subprocess.run(["docker", "exec", "ovn-central", "curl", "-s", "http://localhost:9476/metrics"],
-                                            capture_output=True, text=True)
-                if curl_result.returncode == 0 and "ovn_" in curl_result.stdout:
+                # Fetch metrics from inside the container's network namespace
+                metrics = netns_http_get(ovn_pid, 9476, "/metrics")
+                if metrics is None:
+                    curl_result = ovn_shell.run(["curl", "-s", "http://localhost:9476/metrics"])
+                    metrics = curl_result.stdout if curl_result.returncode == 0 else ""
+                if "ovn_" in metrics:
                     print("   ✓ Metrics endpoint is responding")
-                    print(f"   📈 Sample metrics: {len(curl_result.stdout.split(chr(10)))} lines")
+                    print(f"   📈 Sample metrics: {len(metrics.split(chr(10)))} lines")
                 else:
                     print("   ❌ Metrics endpoint not responding")
             else:
                 print("   ❌ Service is not running in container")
                 print("   Container may need to be restarted")
+            ovn_shell.close()
         else:
             print("   ⚠️  ovn-central container is not running")
 
         # Check node exporter
         print("\n📊 Node Exporter:")
-        result = subprocess.run(["sudo", "systemctl", "status", "prometheus-node-exporter", "--no-pager"],
-                              capture_output=True, text=True)
-        if "active (running)" in result.stdout:
+        if self.systemd.is_active("prometheus-node-exporter"):
             print("   ✓ Service is running")
         else:
             # Try the alternative service name
-            result = subprocess.run(["sudo", "systemctl", "status", "node_exporter", "--no-pager"],
-                                  capture_output=True, text=True)
-            if "active (running)" in result.stdout:
+            if self.systemd.is_active("node_exporter"):
                 print("   ✓ Service is running")
             else:
                 print("   ❌ Service is not running")
 
         # Check host.docker.internal resolution (READ-ONLY check)
         print("\n🌐 Docker Host Resolution:")
-        result = subprocess.run(["grep", "host.docker.internal", "/etc/hosts"],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
+        if not hosts_file_has("host.docker.internal"):
             print("   ❌ host.docker.internal not in /etc/hosts")
             print("   Run: make setup-monitoring to fix this")
         else:
@@ -289,19 +941,15 @@ class MonitoringManager:
         print("\n📊 Prometheus Connectivity:")
 
         # First check if Prometheus container is running
-        prom_status = subprocess.run(
-            ["docker", "ps", "--filter", "name=prometheus", "--format", "{{.Names}}"],
-            capture_output=True, text=True
-        )
-
-        if "prometheus" not in prom_status.stdout:
+        if "prometheus" not in running_containers():
             print("   ❌ Prometheus container is not running")
             print("   Run: make up to start containers")
         else:
+            # Both probes go through one shell session in the container
+            prom_shell = ContainerShell("prometheus")
             # Check OVS exporter with a timeout in wget itself
-            prom_check = subprocess.run(
-                ["docker", "exec", "prometheus", "wget", "-O-", "-q", "-T", "2", "http://host.docker.internal:9475/metrics"],
-                capture_output=True, text=True
+            prom_check = prom_shell.run(
+                ["wget", "-O-", "-q", "-T", "2", "http://host.docker.internal:9475/metrics"]
             )
             if prom_check.returncode == 0 and "ovs_" in prom_check.stdout:
                 print("   ✓ Prometheus can reach OVS exporter")
@@ -313,9 +961,8 @@ class MonitoringManager:
                     print("   This might be a Docker/Lima networking issue")
 
             # Check OVN exporter (using host.docker.internal since port is exposed)
-            prom_check = subprocess.run(
-                ["docker", "exec", "prometheus", "wget", "-O-", "-q", "-T", "2", "http://host.docker.internal:9476/metrics"],
-                capture_output=True, text=True
+            prom_check = prom_shell.run(
+                ["wget", "-O-", "-q", "-T", "2", "http://host.docker.internal:9476/metrics"]
             )
             if prom_check.returncode == 0 and "ovn_" in prom_check.stdout:
                 print("   ✓ Prometheus can reach OVN exporter")
@@ -325,6 +972,7 @@ class MonitoringManager:
                     print("   Connection timed out - check if OVN exporter is running")
                 else:
                     print("   May need to connect Prometheus to transit-overlay network")
+            prom_shell.close()
 
         print("\n" + "="*50)
         return True
@@ -334,154 +982,137 @@ class MonitoringManager:
         logger.info("Setting up OVS exporter...")
 
         # First ensure host.docker.internal is in /etc/hosts for Prometheus connectivity
-        result = subprocess.run(["grep", "host.docker.internal", "/etc/hosts"],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.info("Adding host.docker.internal to /etc/hosts...")
-            # Get the main IP of the host
-            ip_result = subprocess.run(["ip", "-4", "addr", "show", "docker0"],
-                                     capture_output=True, text=True)
-            if "inet " in ip_result.stdout:
-                # Extract IP from docker0 interface
-                for line in ip_result.stdout.split('\n'):
-                    if 'inet ' in line:
-                        ip = line.strip().split()[1].split('/')[0]
-                        add_cmd = f"echo '{ip} host.docker.internal' | sudo tee -a /etc/hosts"
-                        subprocess.run(["bash", "-c", add_cmd], capture_output=True)
-                        logger.info(f"Added host.docker.internal -> {ip}")
-                        break
-
-        # Download and install ovs-exporter
-        arch = subprocess.run(["uname", "-m"], capture_output=True, text=True).stdout.strip()
-        if arch == "aarch64":
-            arch = "arm64"
-        elif arch == "x86_64":
-            arch = "amd64"
+        if not hosts_file_has("host.docker.internal"):
+            logger.debug("Adding host.docker.internal to /etc/hosts...")
+            # Get the main IP of the host from the docker0 interface
+            ip = interface_ipv4("docker0")
+            if ip:
+                entry = f"{ip} host.docker.internal\n"
+                try:
+                    if SUDO:
+                        subprocess.run([*SUDO, "tee", "-a", "/etc/hosts"], input=entry, text=True,
+                                       stdout=subprocess.DEVNULL, check=True)
+                    else:
+                        with open("/etc/hosts", "a") as f:
+                            f.write(entry)
+                    logger.info(f"Added host.docker.internal -> {ip}")
+                except (OSError, subprocess.CalledProcessError) as e:
+                    logger.warning(f"Could not add host.docker.internal to /etc/hosts: {e}")
 
         # Check if already installed
         if os.path.exists("/usr/local/bin/ovs-exporter"):
             logger.info("OVS exporter already installed")
 
             # Ensure OVS has the stable system-id
-            subprocess.run(["sudo", "ovs-vsctl", "set", "open-vswitch", ".",
-                          "external_ids:system-id=chassis-host"],
-                         capture_output=True)
-
-            # Also write system-id.conf to match (exporter checks both)
-            with open("/tmp/system-id.conf", "w") as f:
-                f.write("chassis-host\n")
-            subprocess.run(["sudo", "mv", "/tmp/system-id.conf", "/etc/openvswitch/system-id.conf"], check=True)
-            subprocess.run(["sudo", "chmod", "644", "/etc/openvswitch/system-id.conf"], check=True)
-
-            # Update service file to ensure it has the correct system-id
-            stable_system_id = "chassis-host"
-            service_content = f"""[Unit]
-Description=OVS Exporter for Prometheus
-After=network.target openvswitch-switch.service
-
-[Service]
-Type=simple
-User=root
-ExecStart=/usr/local/bin/ovs-exporter \\
-  --web.listen-address=0.0.0.0:9475 \\
-  --web.telemetry-path=/metrics \\
-  --log.level=info
-Restart=always
-RestartSec=10
-
-[Install]
-WantedBy=multi-user.target
-"""
-            with open("/tmp/ovs-exporter.service", "w") as f:
-                f.write(service_content)
+            subprocess.run([*SUDO, "ovs-vsctl", "--no-wait", "set", "open-vswitch", ".",
+                          f"external_ids:system-id={OVS_SYSTEM_ID}"],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            subprocess.run(["sudo", "mv", "/tmp/ovs-exporter.service", "/etc/systemd/system/"], check=True)
-            subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
+            # Also rewrite system-id.conf and the service file to match
+            unit_changed = self._write_exporter_config()
 
-            # Now restart the service
-            result = subprocess.run(["sudo", "systemctl", "restart", "ovs-exporter"],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            # Now restart the service, reloading systemd only if the unit changed
+            if self.systemd.reload_and_restart("ovs-exporter", reload=unit_changed):
                 logger.info("OVS exporter service restarted with correct system-id")
                 return True
             else:
                 logger.warning("OVS exporter installed but service failed to start, reinstalling...")
                 # Continue with installation
 
-        logger.info(f"Downloading OVS exporter for {arch}...")
-        download_url = f"https://github.com/Liquescent-Development/ovs_exporter/releases/download/v2.3.1/ovs-exporter-2.3.1.linux-{arch}.tar.gz"
-
-        logger.info(f"Download URL: {download_url}")
-        result = subprocess.run([
-            "wget", "-q", "-O", f"/tmp/ovs-exporter-2.3.1.linux-{arch}.tar.gz",
-            download_url
-        ], capture_output=True, text=True)
-
-        if result.returncode != 0:
-            logger.error(f"Failed to download OVS exporter: {result.stderr}")
+        # Download and install ovs-exporter
+        if EXPORTER_ARCH is None:
+            logger.error(f"No OVS exporter release for this architecture ({os.uname().machine})")
             return False
 
-        # Extract and install
-        subprocess.run(["tar", "xzf", f"/tmp/ovs-exporter-2.3.1.linux-{arch}.tar.gz", "-C", "/tmp"], check=True)
-
-        # Stop service first if running to avoid "text file busy"
-        subprocess.run(["sudo", "systemctl", "stop", "ovs-exporter"], check=False)
-
-        # Copy the binary
-        subprocess.run(["sudo", "cp", f"/tmp/ovs-exporter-2.3.1.linux-{arch}/ovs-exporter", "/usr/local/bin/ovs-exporter"], check=True)
-        subprocess.run(["sudo", "chmod", "+x", "/usr/local/bin/ovs-exporter"], check=True)
-
-        # We always use 'chassis-host' as our stable system-id
-        # This is set in setup_chassis() method of OVSChassisManager
-        stable_system_id = "chassis-host"
-
-        # Write system-id.conf to match what's in the database
-        with open("/tmp/system-id.conf", "w") as f:
-            f.write("chassis-host\n")
-        subprocess.run(["sudo", "mv", "/tmp/system-id.conf", "/etc/openvswitch/system-id.conf"], check=True)
-        subprocess.run(["sudo", "chmod", "644", "/etc/openvswitch/system-id.conf"], check=True)
-
-        # Create systemd service (exporter reads system-id from OVS database)
-        service_content = f"""[Unit]
-Description=OVS Exporter for Prometheus
-After=network.target openvswitch-switch.service
+        logger.info(f"Downloading OVS exporter for {EXPORTER_ARCH}...")
+        download_url = OVS_EXPORTER_URL
+
+        logger.debug("Download URL: %s", download_url)
+
+        # Stream the tarball straight out of the HTTP response and extract only
+        # the binary, hashing the download on the way through. The binary is
+        # written next to its destination and renamed over it once verified,
+        # so a running exporter doesn't cause "text file busy". Without root
+        # it is staged in /tmp and put in place by `sudo install`, which also
+        # replaces rather than overwrites the old binary.
+        import hashlib
+        import tarfile
+        import tempfile
+        import urllib.request
+        binary_path = "/usr/local/bin/ovs-exporter"
+        if SUDO:
+            staging_path = os.path.join(tempfile.gettempdir(), "ovs-exporter.new")
+        else:
+            staging_path = f"{binary_path}.new"
+        try:
+            with urllib.request.urlopen(download_url, timeout=30) as response:
+                download = HashingReader(response, hashlib.sha256())
+                with tarfile.open(fileobj=download, mode="r|gz") as tar:
+                    for member in tar:
+                        if member.isfile() and member.name.endswith("/ovs-exporter"):
+                            with open(staging_path, "wb") as f:
+                                shutil.copyfileobj(tar.extractfile(member), f)
+                            break
+                    else:
+                        raise tarfile.TarError("no ovs-exporter binary in the archive")
+                while download.read(65536):
+                    pass  # Hash the rest of the archive
+
+            digest = download.hash.hexdigest()
+            expected = OVS_EXPORTER_SHA256.get(EXPORTER_ARCH)
+            if expected is None:
+                logger.warning(f"No pinned checksum for {OVS_EXPORTER_RELEASE}, installing unverified (sha256 {digest})")
+            elif digest != expected:
+                os.remove(staging_path)
+                logger.error(f"Checksum mismatch for {OVS_EXPORTER_RELEASE}: got {digest}, expected {expected}")
+                return False
+            if SUDO:
+                subprocess.run([*SUDO, "install", "-m", "755", staging_path, binary_path], check=True)
+                os.remove(staging_path)
+            else:
+                os.chmod(staging_path, 0o755)
+                os.replace(staging_path, binary_path)
+        except (OSError, tarfile.TarError, subprocess.CalledProcessError) as e:
+            logger.error(f"Failed to download OVS exporter: {e}")
+            if os.path.exists(staging_path):
+                os.remove(staging_path)
+            return False
 
-[Service]
-Type=simple
-User=root
-ExecStart=/usr/local/bin/ovs-exporter \\
-  --web.listen-address=0.0.0.0:9475 \\
-  --web.telemetry-path=/metrics \\
-  --log.level=info
-Restart=always
-RestartSec=10
+        # Write system-id.conf and the systemd service. Always reload here:
+        # the unit may already be on disk from an earlier attempt whose
+        # reload never happened, which is also why a restart could fail.
+        self._write_exporter_config()
 
-[Install]
-WantedBy=multi-user.target
-"""
+        if not self.systemd.reload_and_restart("ovs-exporter", enable=True):
+            logger.error(f"Failed to start OVS exporter service: {self.systemd.error}")
+            return False
 
-        with open("/tmp/ovs-exporter.service", "w") as f:
-            f.write(service_content)
+        logger.info(f"✅ OVS exporter {OVS_EXPORTER_VERSION} ({EXPORTER_ARCH}) installed and started")
+        return True
 
-        subprocess.run(["sudo", "mv", "/tmp/ovs-exporter.service", "/etc/systemd/system/"], check=True)
-        subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
-        subprocess.run(["sudo", "systemctl", "enable", "ovs-exporter"], check=True)
-        subprocess.run(["sudo", "systemctl", "restart", "ovs-exporter"], check=True)
+    def _write_exporter_config(self) -> bool:
+        """Write system-id.conf and the ovs-exporter unit file
 
-        logger.info("✅ OVS exporter installed and started")
-        return True
+        The exporter checks the system-id in both the OVS database and
+        system-id.conf, so the file has to match what setup_chassis() sets.
+        Returns whether the unit file changed and needs a daemon-reload.
+        """
+        write_file("/etc/openvswitch/system-id.conf", OVS_SYSTEM_ID_CONF)
+        return write_file("/etc/systemd/system/ovs-exporter.service", OVS_EXPORTER_UNIT)
 
     def setup_node_exporter(self) -> bool:
         """Setup node exporter"""
         logger.info("Setting up node exporter...")
 
-        # Check if already installed
-        if os.path.exists("/usr/local/bin/node_exporter"):
+        # Check if already installed, either by hand or from the apt package
+        # (which installs /usr/bin/prometheus-node-exporter), so repeat runs
+        # don't go through apt-get at all
+        if any(os.path.exists(path) for path in NODE_EXPORTER_BINARIES):
             logger.info("Node exporter already installed")
             return True
 
         # Install via apt
-        result = subprocess.run(["sudo", "apt-get", "install", "-y", "prometheus-node-exporter"],
+        result = subprocess.run([*SUDO, "apt-get", "install", "-y", "prometheus-node-exporter"],
                               capture_output=True, text=True)
 
         if result.returncode == 0:
@@ -495,6 +1126,27 @@ WantedBy=multi-user.target
 class OVSChassisManager:
     """Manages OVS chassis configuration"""
 
+    def chassis_settings(self, ovn_ip="172.30.0.5", encap_ip="172.30.0.1") -> list:
+        """Return the Open_vSwitch external_ids that attach this chassis to OVN"""
+        return [
+            f"external_ids:ovn-remote=tcp:{ovn_ip}:6642",
+            f"external_ids:ovn-encap-ip={encap_ip}",
+            "external_ids:ovn-encap-type=geneve",
+            f"external_ids:system-id={OVS_SYSTEM_ID}",
+        ]
+
+    def exec_chassis(self, ovn_ip="172.30.0.5", encap_ip="172.30.0.1"):
+        """Replace the orchestrator process with the chassis setup commands
+
+        The whole setup is a single ovs-vsctl transaction followed by starting
+        ovn-controller, so hand it to a shell via exec instead of keeping the
+        Python interpreter alive around it. Does not return.
+        """
+        logger.info(f"Handing off chassis setup (OVN at tcp:{ovn_ip}:6642, encap IP {encap_ip})")
+        script = 'ovs-vsctl --no-wait set open-vswitch . "$@" || exit 1; systemctl start ovn-controller; exit 0'
+        argv = [*SUDO, "sh", "-c", script, "setup-chassis"] + self.chassis_settings(ovn_ip, encap_ip)
+        os.execvp(argv[0], argv)
+
     def setup_chassis(self, ovn_ip="172.30.0.5", encap_ip="172.30.0.1") -> bool:
         """Configure host OVS to connect to OVN
 
@@ -506,22 +1158,18 @@ class OVSChassisManager:
         logger.info(f"Configuring OVS chassis to connect to OVN at {ovn_sb_endpoint}")
         logger.info(f"Using encapsulation IP: {encap_ip}")
 
-        # Configure OVS to connect to OVN
-        commands = [
-            ["sudo", "ovs-vsctl", "set", "open-vswitch", ".", f"external_ids:ovn-remote={ovn_sb_endpoint}"],
-            ["sudo", "ovs-vsctl", "set", "open-vswitch", ".", f"external_ids:ovn-encap-ip={encap_ip}"],
-            ["sudo", "ovs-vsctl", "set", "open-vswitch", ".", "external_ids:ovn-encap-type=geneve"],
-            ["sudo", "ovs-vsctl", "set", "open-vswitch", ".", "external_ids:system-id=chassis-host"]
-        ]
-
-        for cmd in commands:
-            result = subprocess.run(cmd, capture_output=True)
-            if result.returncode != 0:
-                logger.error(f"Failed to run: {' '.join(cmd)}")
-                return False
+        # Configure OVS to connect to OVN in a single ovs-vsctl transaction
+        # --no-wait: only ovn-controller reads these keys, so there's no
+        # ovs-vswitchd reconfiguration worth waiting for
+        cmd = ([*SUDO, "ovs-vsctl", "--no-wait", "set", "open-vswitch", "."]
+               + self.chassis_settings(ovn_ip, encap_ip))
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode != 0:
+            logger.error(f"Failed to run: {' '.join(cmd)}")
+            return False
 
         # Start ovn-controller if not running
-        subprocess.run(["sudo", "systemctl", "start", "ovn-controller"], check=False)
+        subprocess.run([*SUDO, "systemctl", "start", "ovn-controller"], check=False)
 
         logger.info("✅ OVS chassis configured")
         return True
@@ -532,6 +1180,7 @@ class NetworkChecker:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.running = set()
 
     def check_all(self):
         """Run all network checks"""
@@ -539,37 +1188,33 @@ class NetworkChecker:
         print("NETWORK DIAGNOSTIC CHECK")
         print("="*60)
 
-        issues = []
+        sections = [
+            ("1. OVS Bridge Status", self._check_ovs),
+            ("2. OVN Logical Configuration", self._check_ovn),
+            ("3. OVN Port Bindings", self._check_bindings),
+            ("4. Container Connectivity", self._check_connectivity),
+            ("5. Docker Plugin Status", self._check_plugin),
+        ]
+
+        # One container listing serves every section's "is it running" checks
+        self.running = running_containers()
+
+        # The checks are independent, so run them concurrently with each one's
+        # output buffered, then print the sections in order
+        output = ThreadLocalOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+                results = list(pool.map(output.capture, [check for _, check in sections]))
+        finally:
+            sys.stdout = output.stream
 
-        # Check OVS
-        print("\n1. OVS Bridge Status:")
-        print("-" * 40)
-        ovs_issues = self._check_ovs()
-        issues.extend(ovs_issues)
-
-        # Check OVN
-        print("\n2. OVN Logical Configuration:")
-        print("-" * 40)
-        ovn_issues = self._check_ovn()
-        issues.extend(ovn_issues)
-
-        # Check bindings
-        print("\n3. OVN Port Bindings:")
-        print("-" * 40)
-        binding_issues = self._check_bindings()
-        issues.extend(binding_issues)
-
-        # Check connectivity
-        print("\n4. Container Connectivity:")
-        print("-" * 40)
-        conn_issues = self._check_connectivity()
-        issues.extend(conn_issues)
-
-        # Check Docker plugin
-        print("\n5. Docker Plugin Status:")
-        print("-" * 40)
-        plugin_issues = self._check_plugin()
-        issues.extend(plugin_issues)
+        issues = []
+        for (title, _), (text, section_issues) in zip(sections, results):
+            print(f"\n{title}:")
+            print("-" * 40)
+            print(text, end="")
+            issues.extend(section_issues)
 
         # Summary
         print("\n" + "="*60)
@@ -588,31 +1233,23 @@ class NetworkChecker:
         """Check OVS configuration"""
         issues = []
 
+        ports, iface_ids = self._br_int_ports()
+
         # Check if br-int exists
-        result = subprocess.run(["sudo", "ovs-vsctl", "br-exists", "br-int"],
-                              capture_output=True)
-        if result.returncode != 0:
+        if ports is None:
             print("  ❌ br-int bridge does not exist")
             issues.append("OVS integration bridge (br-int) missing")
+            ports = []
         else:
             print("  ✓ br-int bridge exists")
 
         # Check ports on br-int
-        result = subprocess.run(["sudo", "ovs-vsctl", "list-ports", "br-int"],
-                              capture_output=True, text=True)
-        ports = result.stdout.strip().split('\n') if result.stdout.strip() else []
         print(f"  ✓ {len(ports)} ports on br-int")
 
         # Check for external_ids on interfaces
-        missing_iface_id = []
-        for port in ports:
-            if port and not port.startswith("ovn"):  # Skip OVN tunnel ports
-                result = subprocess.run(
-                    ["sudo", "ovs-vsctl", "get", "interface", port, "external_ids:iface-id"],
-                    capture_output=True, text=True
-                )
-                if not result.stdout.strip() or result.returncode != 0:
-                    missing_iface_id.append(port)
+        missing_iface_id = [port for port in ports
+                            if not port.startswith("ovn")  # Skip OVN tunnel ports
+                            and not iface_ids.get(port)]
 
         if missing_iface_id:
             print(f"  ❌ {len(missing_iface_id)} ports missing iface-id: {', '.join(missing_iface_id)}")
@@ -622,86 +1259,117 @@ class NetworkChecker:
 
         return issues
 
+    def _br_int_ports(self):
+        """Return (br-int port names, {interface name: iface-id})
+
+        Port names are None if br-int does not exist. Everything is read in
+        one JSON-RPC transaction on the local OVS database, or one chained
+        ovs-vsctl call if the socket can't be used.
+        """
+        try:
+            bridges, ports, interfaces = ovsdb_transact(OVS_DB_REMOTE, "Open_vSwitch", [
+                {"op": "select", "table": "Bridge", "where": [["name", "==", "br-int"]], "columns": ["ports"]},
+                {"op": "select", "table": "Port", "where": [], "columns": ["_uuid", "name"]},
+                {"op": "select", "table": "Interface", "where": [], "columns": ["name", "external_ids"]},
+            ])
+            iface_ids = {row["name"]: dict(row["external_ids"][1]).get("iface-id", "")
+                         for row in interfaces["rows"]}
+            if not bridges["rows"]:
+                return None, iface_ids
+            # A set column is ["set", [...]], except for a single element
+            members = bridges["rows"][0]["ports"]
+            members = members[1] if members[0] == "set" else [members]
+            names = {row["_uuid"][1]: row["name"] for row in ports["rows"]}
+            # Like list-ports, leave out the bridge's own local port
+            return [names[uuid] for _, uuid in members if names[uuid] != "br-int"], iface_ids
+        except (OSError, KeyError, ValueError, IndexError):
+            pass
+
+        # Socket not accessible, batch the reads through ovs-vsctl instead
+        result = subprocess.run([*SUDO, "ovs-vsctl", "--format=json",
+                                 "--", "list-ports", "br-int",
+                                 "--", "--columns=name,external_ids", "list", "interface"],
+                                capture_output=True, text=True)
+        if result.returncode != 0:  # Fails as a whole if br-int is missing
+            return None, {}
+        port_list, _, table = result.stdout.partition("{")
+        iface_ids = {name: dict(external_ids[1]).get("iface-id", "")
+                     for name, external_ids in json.loads("{" + table)["data"]}
+        return port_list.split(), iface_ids
+
     def _check_ovn(self):
         """Check OVN logical configuration"""
         issues = []
 
         # Check if OVN central is running
-        result = subprocess.run(["docker", "ps", "-q", "-f", "name=ovn-central"],
-                              capture_output=True, text=True)
-        if not result.stdout.strip():
+        if "ovn-central" not in self.running:
             print("  ❌ OVN central container not running")
             issues.append("OVN central container is not running")
             return issues  # Can't check OVN if container isn't running
 
+        routers, switches = self._list_logical_names()
+
         # Check logical routers
-        result = subprocess.run(
-            ["docker", "exec", "ovn-central", "ovn-nbctl", "lr-list"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
+        if routers is None:
             print("  ❌ Failed to query logical routers")
             issues.append("Cannot query OVN logical routers")
+        elif routers:
+            print(f"  ✓ {len(routers)} logical routers configured")
         else:
-            routers = [line.split()[1].strip('()') for line in result.stdout.strip().split('\n') if line]
-            if routers:
-                print(f"  ✓ {len(routers)} logical routers configured")
-            else:
-                print("  ⚠ No logical routers configured")
+            print("  ⚠ No logical routers configured")
 
         # Check logical switches
-        result = subprocess.run(
-            ["docker", "exec", "ovn-central", "ovn-nbctl", "ls-list"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
+        if switches is None:
             print("  ❌ Failed to query logical switches")
             issues.append("Cannot query OVN logical switches")
         else:
-            switches = [line.split()[1].strip('()') for line in result.stdout.strip().split('\n') if line]
             print(f"  ✓ {len(switches)} logical switches configured")
 
         return issues
 
+    def _list_logical_names(self):
+        """Return (router names, switch names), with None for a failed query"""
+        # Both tables in one JSON-RPC round-trip straight to the NB database
+        try:
+            results = ovsdb_transact(OVN_NB_REMOTE, "OVN_Northbound", [
+                {"op": "select", "table": table, "where": [], "columns": ["name"]}
+                for table in ("Logical_Router", "Logical_Switch")
+            ])
+            return tuple([row["name"] for row in result["rows"]] for result in results)
+        except (OSError, KeyError, ValueError):
+            pass
+
+        # NB database not reachable from the host, go through ovn-nbctl with
+        # both listings chained in one invocation (one JSON table per line)
+        result = run_nbctl(["--format=json",
+                            "--columns=name", "list", "Logical_Router", "--",
+                            "--columns=name", "list", "Logical_Switch"])
+        if result.returncode != 0:
+            return None, None
+        try:
+            tables = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+            return tuple([row[0] for row in table["data"]] for table in tables)
+        except (ValueError, KeyError, IndexError):
+            return None, None
+
     def _check_bindings(self):
         """Check OVN port bindings to chassis"""
         issues = []
 
         # Check if OVN central is running
-        result = subprocess.run(["docker", "ps", "-q", "-f", "name=ovn-central"],
-                              capture_output=True, text=True)
-        if not result.stdout.strip():
+        if "ovn-central" not in self.running:
             print("  ⚠ OVN central not running, skipping binding checks")
             return issues
 
         # Get all logical ports
-        result = subprocess.run(
-            ["docker", "exec", "ovn-central", "ovn-sbctl", "find", "port_binding", "type=\"\""],
-            capture_output=True, text=True
-        )
+        bindings = self._port_bindings()
 
-        if result.returncode != 0:
+        if bindings is None:
             print("  ⚠ Cannot check port bindings (OVN SB not accessible)")
             return issues
 
-        unbound_ports = []
-        bound_ports = 0
-        current_port = None
-
-        for line in result.stdout.split('\n'):
-            if 'logical_port' in line and ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    current_port = parts[1].strip().strip('"')
-            elif line.startswith('chassis') and ':' in line and current_port:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    chassis = parts[1].strip()
-                    if chassis == '[]' or not chassis:
-                        unbound_ports.append(current_port)
-                    else:
-                        bound_ports += 1
-                    current_port = None
+        unbound_ports = [port for port, bound in bindings if not bound]
+        bound_ports = len(bindings) - len(unbound_ports)
 
         if unbound_ports:
             print(f"  ❌ {len(unbound_ports)} ports not bound to chassis: {', '.join(unbound_ports[:5])}")
@@ -713,6 +1381,31 @@ class NetworkChecker:
 
         return issues
 
+    def _port_bindings(self):
+        """Return [(logical port, bound to a chassis)] for VIF ports, or None on failure"""
+        # Only the two needed columns, in one JSON-RPC select on the SB database
+        try:
+            result, = ovsdb_transact(OVN_SB_REMOTE, "OVN_Southbound", [
+                {"op": "select", "table": "Port_Binding", "where": [["type", "==", ""]],
+                 "columns": ["logical_port", "chassis"]},
+            ])
+            # An unset optional reference is the empty set
+            return [(row["logical_port"], row["chassis"] != ["set", []])
+                    for row in result["rows"]]
+        except (OSError, KeyError, ValueError):
+            pass
+
+        # SB database not reachable from the host, go through ovn-sbctl
+        result = run_sbctl(["--format=json", "--columns=logical_port,chassis",
+                            "find", "port_binding", "type=\"\""])
+        if result.returncode != 0:
+            return None
+        try:
+            return [(port, chassis != ["set", []])
+                    for port, chassis in json.loads(result.stdout)["data"]]
+        except (ValueError, KeyError, TypeError):
+            return None
+
     def _check_connectivity(self):
         """Check basic container connectivity"""
         issues = []
@@ -720,18 +1413,12 @@ class NetworkChecker:
         # Check if test containers exist
         test_containers = ["vpc-a-web", "vpc-b-web"]
         for container in test_containers:
-            result = subprocess.run(["docker", "ps", "-q", "-f", f"name={container}"],
-                                  capture_output=True, text=True)
-            if not result.stdout.strip():
+            if container not in self.running:
                 print(f"  ⚠ Container {container} not found, skipping connectivity test")
                 continue
 
             # Test container to gateway connectivity
-            result = subprocess.run(
-                ["docker", "exec", container, "ping", "-c", "1", "-W", "1", "10.0.1.1"],
-                capture_output=True
-            )
-            if result.returncode != 0:
+            if not container_ping(container, "10.0.1.1"):
                 print(f"  ❌ {container} cannot reach its gateway")
                 issues.append(f"{container} to gateway connectivity failed")
             else:
@@ -744,18 +1431,14 @@ class NetworkChecker:
         """Check Docker plugin status"""
         issues = []
 
-        result = subprocess.run(["docker", "plugin", "ls", "--format", "{{.Name}}:{{.Enabled}}"],
-                              capture_output=True, text=True)
-
-        plugin_found = False
-        plugin_enabled = False
+        try:
+            plugins = docker_plugins()
+        except subprocess.CalledProcessError:
+            plugins = {}
 
-        for line in result.stdout.strip().split('\n'):
-            if "ovs-container-network" in line:
-                plugin_found = True
-                if ":true" in line:
-                    plugin_enabled = True
-                break
+        # Exact lookup by name instead of a substring scan of the listing
+        plugin_found = PLUGIN_NAME in plugins
+        plugin_enabled = plugins.get(PLUGIN_NAME, False)
 
         if not plugin_found:
             print("  ❌ OVS Container Network plugin not installed")
@@ -780,39 +1463,27 @@ class TrafficGenerator:
         print("\n🔍 Checking Traffic Generation Status")
         print("="*50)
 
-        # Define traffic pattern specifications
-        traffic_specs = {
-            'standard': {
-                'bandwidth': '100 Mbps',
-                'pps': '1000 packets/sec',
-                'connections': '20 concurrent',
-                'cpu': '50% limit'
-            },
-            'high': {
-                'bandwidth': '500 Mbps',
-                'pps': '5000 packets/sec',
-                'connections': '40 concurrent',
-                'cpu': '70% limit'
-            },
-            'chaos': {
-                'bandwidth': '1000 Mbps',
-                'pps': '10000 packets/sec',
-                'connections': '60 concurrent',
-                'cpu': '90% limit'
-            }
-        }
-
-        traffic_gens = ["traffic-gen-a", "traffic-gen-b"]
+        traffic_gens = TRAFFIC_GENERATORS
         active_pattern = None
         all_running = True
+        # One long-lived shell per generator serves all of the probes below
+        shells = {gen: ContainerShell(gen) for gen in traffic_gens}
+        running = running_containers()
+
+        # Start the connectivity pings right away so they overlap with the
+        # process checks below instead of adding ~1s per generator at the end
+        ping_pool = ThreadPoolExecutor(max_workers=len(traffic_gens))
+        pings = {}
+        for gen in traffic_gens:
+            if gen in running:
+                ip, name = TRAFFIC_TARGETS[gen]
+                pings[gen] = [(ip, name, ping_pool.submit(container_ping, gen, ip))]
 
         for gen in traffic_gens:
             print(f"\n📦 {gen}:")
 
             # Check if container is running
-            result = subprocess.run(["docker", "ps", "--format", "{{.Names}}", "-f", f"name={gen}"],
-                                  capture_output=True, text=True)
-            if gen not in result.stdout:
+            if gen not in running:
                 print(f"   ❌ Container not running")
                 all_running = False
                 continue
@@ -820,43 +1491,28 @@ class TrafficGenerator:
                 print(f"   ✓ Container is running")
 
             # Check if traffic-gen.py process is running and detect mode
-            ps_result = subprocess.run(["docker", "exec", gen, "ps", "aux"],
-                                      capture_output=True, text=True)
+            ps_result = shells[gen].run(["ps", "aux"])
 
+            # The matching ps line also carries the PID and CPU usage. Match on
+            # the parsed argv rather than substrings of the whole line
             traffic_running = False
             for line in ps_result.stdout.split('\n'):
-                if 'traffic-gen.py' in line and 'python' in line:
+                fields = line.split(None, 10)  # COMMAND is the 11th ps aux column
+                argv = fields[10].split() if len(fields) == 11 else []
+                if len(argv) >= 2 and 'python' in argv[0] and argv[1].endswith('traffic-gen.py'):
                     traffic_running = True
-                    # Try to detect mode from command line (positional argument)
-                    if 'traffic-gen.py chaos' in line:
-                        active_pattern = 'chaos'
-                    elif 'traffic-gen.py high' in line:
-                        active_pattern = 'high'
-                    elif 'traffic-gen.py standard' in line:
-                        active_pattern = 'standard'
-                    else:
-                        # Default to standard if no mode specified
-                        active_pattern = 'standard'
+                    pid, cpu_usage = fields[1], fields[2]
+                    # Mode is the positional argument, standard if none is given
+                    mode = argv[2] if len(argv) > 2 else 'standard'
+                    active_pattern = mode if mode in TRAFFIC_SPECS else 'standard'
                     break
 
             if traffic_running:
-                pgrep_result = subprocess.run(["docker", "exec", gen, "pgrep", "-f", "traffic-gen.py"],
-                                            capture_output=True, text=True)
-                pid = pgrep_result.stdout.strip()
                 print(f"   ✓ traffic-gen.py is running (PID: {pid})")
-
-                # Check CPU usage of the process
-                cpu_result = subprocess.run(
-                    ["docker", "exec", gen, "ps", "-p", pid, "-o", "%cpu="],
-                    capture_output=True, text=True
-                )
-                if cpu_result.returncode == 0:
-                    cpu_usage = cpu_result.stdout.strip()
-                    print(f"   📊 CPU Usage: {cpu_usage}%")
+                print(f"   📊 CPU Usage: {cpu_usage}%")
 
                 # Check last few lines of output
-                log_result = subprocess.run(["docker", "exec", gen, "tail", "-5", "/tmp/traffic.log"],
-                                          capture_output=True, text=True)
+                log_result = shells[gen].run(["tail", "-5", "/tmp/traffic.log"])
                 if log_result.returncode == 0 and log_result.stdout:
                     print(f"   📋 Recent activity:")
                     for line in log_result.stdout.split('\n')[:3]:
@@ -879,15 +1535,8 @@ class TrafficGenerator:
 
             # Test connectivity to targets
             print(f"   🌐 Testing connectivity:")
-            targets = [
-                ("10.0.1.10", "vpc-a-web") if "gen-a" in gen else ("10.1.1.10", "vpc-b-web")
-            ]
-            for ip, name in targets:
-                ping_result = subprocess.run(
-                    ["docker", "exec", gen, "ping", "-c", "1", "-W", "1", ip],
-                    capture_output=True, text=True
-                )
-                if ping_result.returncode == 0:
+            for ip, name, ping in pings[gen]:
+                if ping.result():
                     print(f"      ✓ Can reach {name} ({ip})")
                 else:
                     print(f"      ❌ Cannot reach {name} ({ip})")
@@ -899,7 +1548,7 @@ class TrafficGenerator:
 
         if active_pattern and all_running:
             print(f"\n🎯 Active Pattern: {active_pattern.upper()}")
-            specs = traffic_specs.get(active_pattern, {})
+            specs = TRAFFIC_SPECS.get(active_pattern, {})
             print("\n📈 Expected Performance Targets:")
             for metric, value in specs.items():
                 print(f"   • {metric.replace('_', ' ').title()}: {value}")
@@ -909,64 +1558,25 @@ class TrafficGenerator:
 
             # Try to get metrics from InfluxDB or Prometheus
             # Check bandwidth via container network stats
-            total_bandwidth_mbps = 0
-            for gen in traffic_gens:
-                stats_result = subprocess.run(
-                    ["docker", "stats", "--no-stream", "--format", "{{.Container}}: {{.NetIO}}", gen],
-                    capture_output=True, text=True
-                )
-                if stats_result.returncode == 0 and stats_result.stdout.strip():
-                    print(f"   • {stats_result.stdout.strip()}")
-                    # Try to parse the network I/O to estimate bandwidth
-                    # Format is usually like "1.2MB / 3.4MB" (received / sent)
-                    try:
-                        net_io = stats_result.stdout.split(':')[1].strip()
-                        parts = net_io.split('/')
-                        if len(parts) >= 2:
-                            sent = parts[1].strip()
-                            # Convert to MB/s (very rough estimate)
-                            if 'MB' in sent:
-                                mb_value = float(sent.replace('MB', '').strip())
-                                # This is cumulative, not rate - need better metric
-                            elif 'kB' in sent:
-                                kb_value = float(sent.replace('kB', '').strip())
-                    except:
-                        pass
+            # One sample covers all generators (each `docker stats` call takes
+            # a full sampling interval)
+            stats_result = subprocess.run(
+                ["docker", "stats", "--no-stream", "--format", "{{.Container}}: {{.NetIO}}", *traffic_gens],
+                capture_output=True, text=True
+            )
+            if stats_result.returncode == 0:
+                for line in stats_result.stdout.strip().split('\n'):
+                    if line:
+                        print(f"   • {line}")
 
             # Check if meeting goals
             print("\n📊 Performance Assessment:")
 
-            # Define expected bandwidth for each pattern
-            expected_bandwidth = {
-                'standard': 100,   # 100 Mbps
-                'high': 500,       # 500 Mbps
-                'chaos': 1000      # 1000 Mbps (1 Gbps)
-            }
+            if active_pattern in TRAFFIC_BANDWIDTH_MBPS:
+                expected_mbps = TRAFFIC_BANDWIDTH_MBPS[active_pattern]
 
-            if active_pattern in expected_bandwidth:
-                expected_mbps = expected_bandwidth[active_pattern]
-
-                # Check network interface statistics for better bandwidth measurement
                 print(f"\n   Checking actual bandwidth (expected: {expected_mbps} Mbps)...")
 
-                # Try to get more accurate metrics from container network interfaces
-                for gen in traffic_gens:
-                    # Get network stats from inside container
-                    ifstat_result = subprocess.run(
-                        ["docker", "exec", gen, "cat", "/proc/net/dev"],
-                        capture_output=True, text=True
-                    )
-                    if ifstat_result.returncode == 0:
-                        # Parse /proc/net/dev for eth0 statistics
-                        for line in ifstat_result.stdout.split('\n'):
-                            if 'eth0' in line:
-                                parts = line.split()
-                                if len(parts) >= 10:
-                                    rx_bytes = int(parts[1])
-                                    tx_bytes = int(parts[9])
-                                    # These are cumulative, need rate calculation
-                                    break
-
                 # Performance verdict based on pattern
                 if active_pattern == 'standard':
                     print("\n   ⚠️  Standard traffic pattern (100 Mbps target)")
@@ -994,6 +1604,10 @@ class TrafficGenerator:
             print("   Run 'make traffic-run' for standard traffic")
             print("   Run 'make traffic-chaos' for chaos testing")
 
+        for shell in shells.values():
+            shell.close()
+        ping_pool.shutdown()
+
         print("\n" + "="*50)
         return True
 
@@ -1002,29 +1616,32 @@ class TrafficGenerator:
         self.logger.info(f"Starting traffic generators in {mode} mode...")
 
         # Check if traffic generator containers exist
-        traffic_gens = ["traffic-gen-a", "traffic-gen-b"]
+        traffic_gens = TRAFFIC_GENERATORS
+        running = running_containers()
         for gen in traffic_gens:
-            result = subprocess.run(["docker", "ps", "-q", "-f", f"name={gen}"],
-                                  capture_output=True, text=True)
-            if not result.stdout.strip():
+            if gen not in running:
                 self.logger.error(f"Traffic generator {gen} not found. Please run 'make up' first.")
                 return False
 
         # Start traffic generation scripts
-        for gen in traffic_gens:
-            # Kill any existing traffic generation processes
-            subprocess.run(
-                ["docker", "exec", gen, "pkill", "-f", "traffic-gen.py"],
-                capture_output=True
-            )
-
-            # Start new traffic generation (use nohup for proper backgrounding)
-            cmd = f"cd /workspace && nohup python3 traffic-gen.py {mode} > /tmp/traffic.log 2>&1 & sleep 1"
-            result = subprocess.run(
+        # Kill any existing traffic generation processes and start the new one
+        # in a single exec (use nohup for proper backgrounding). The pkill
+        # pattern is anchored on the interpreter so it can't match this shell.
+        cmd = ("pkill -f '^[^ ]*python[^ ]* [^ ]*traffic-gen[.]py'; "
+               f"cd /workspace && nohup python3 traffic-gen.py {mode} > /tmp/traffic.log 2>&1 & sleep 1")
+
+        # The generators are independent, so start them all at once rather
+        # than paying each exec (and its 1s settle) in turn
+        def start(gen):
+            return subprocess.run(
                 ["docker", "exec", gen, "bash", "-c", cmd],
                 capture_output=True, text=True, timeout=5
             )
 
+        with ThreadPoolExecutor(max_workers=len(traffic_gens)) as pool:
+            results = list(pool.map(start, traffic_gens))
+
+        for gen, result in zip(traffic_gens, results):
             if result.returncode == 0:
                 self.logger.info(f"Started {mode} traffic generation on {gen}")
             else:
@@ -1041,14 +1658,19 @@ class TrafficGenerator:
         """Stop all traffic generators"""
         self.logger.info("Stopping traffic generators...")
 
-        traffic_gens = ["traffic-gen-a", "traffic-gen-b"]
-        for gen in traffic_gens:
-            # Kill traffic generation processes
-            result = subprocess.run(
+        traffic_gens = TRAFFIC_GENERATORS
+
+        # Kill traffic generation processes on all generators concurrently
+        def stop(gen):
+            return subprocess.run(
                 ["docker", "exec", gen, "pkill", "-f", "traffic-gen.py"],
-                capture_output=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
 
+        with ThreadPoolExecutor(max_workers=len(traffic_gens)) as pool:
+            results = list(pool.map(stop, traffic_gens))
+
+        for gen, result in zip(traffic_gens, results):
             if result.returncode in [0, 1]:  # 0 = killed, 1 = no process found
                 self.logger.info(f"Stopped traffic generation on {gen}")
             else:
@@ -1075,18 +1697,16 @@ class ChaosEngineer:
             "mixed": self._mixed_chaos,
         }
 
-    def discover_containers(self, pattern: str = None, label: str = None):
-        """Discover running containers based on pattern or label"""
-        if label:
-            cmd = ["docker", "ps", "--format", "{{.Names}}", "--filter", f"label={label}"]
-        else:
-            cmd = ["docker", "ps", "--format", "{{.Names}}"]
+    def discover_containers(self, pattern: str = None, label: str = None, containers: list = None):
+        """Discover running containers based on pattern or label
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        containers = result.stdout.strip().split('\n') if result.stdout.strip() else []
+        Pass an already fetched list of container names as `containers` to
+        filter it instead of querying docker again.
+        """
+        if containers is None:
+            containers = sorted(running_containers(label))
 
         if pattern and containers:
-            import re
             regex = re.compile(pattern)
             containers = [c for c in containers if regex.match(c)]
 
@@ -1096,59 +1716,121 @@ class ChaosEngineer:
         """Get container groups based on current docker-compose setup"""
         groups = {
             'vpc-containers': [],
+            'vpc-a': [],
+            'vpc-b': [],
             'traffic-generators': [],
             'infrastructure': [],
             'monitoring': []
         }
 
+        # List running containers once and classify them locally
+        infra_containers = self.discover_containers()
+
         # Discover VPC containers (vpc-a-*, vpc-b-*)
-        groups['vpc-containers'] = self.discover_containers(pattern="vpc-[ab]-.*")
+        groups['vpc-containers'] = self.discover_containers(pattern="vpc-[ab]-.*",
+                                                            containers=infra_containers)
+        # Split them by VPC here so callers don't re-scan the names
+        for c in groups['vpc-containers']:
+            groups[c[:5]].append(c)  # 'vpc-a-web' -> 'vpc-a'
 
         # Discover traffic generators
-        groups['traffic-generators'] = self.discover_containers(pattern="traffic-gen-.*")
+        groups['traffic-generators'] = self.discover_containers(pattern="traffic-gen-.*",
+                                                                containers=infra_containers)
 
         # Discover infrastructure (ovn-central, nat-gateway)
-        infra_containers = self.discover_containers()
         groups['infrastructure'] = [c for c in infra_containers
-                                   if c in ['ovn-central', 'nat-gateway', 'ovs-vpc-a', 'ovs-vpc-b']]
+                                   if c in INFRASTRUCTURE_CONTAINERS]
 
         # Discover monitoring
         groups['monitoring'] = [c for c in infra_containers
-                               if c in ['prometheus', 'grafana', 'influxdb', 'telegraf']]
+                               if c in MONITORING_CONTAINERS]
 
         return groups
 
     def check_container_network(self, container_name: str) -> dict:
         """Check network configuration of a container"""
-        info = {
+        return self.check_container_networks([container_name])[container_name]
+
+    def check_container_networks(self, container_names: list) -> dict:
+        """Check network configuration of several containers, keyed by name
+
+        A single `docker inspect` covers all of the containers; only the
+        interface probes inside each network namespace are per container.
+        """
+        infos = {name: {
             'exists': False,
             'network_driver': None,
             'interface': None,
             'ip_address': None
-        }
-
-        # Get container network info
-        cmd = ["docker", "inspect", container_name, "--format",
-               "{{range .NetworkSettings.Networks}}{{.Driver}}|{{.IPAddress}}{{end}}"]
+        } for name in container_names}
+        if not container_names:
+            return infos
+
+        # Get container network info (and its PID for namespace access)
+        pids = {}
+        for name, pid, driver, ip_address in self._inspect_networks(container_names):
+            if name in infos:
+                infos[name]['exists'] = True
+                infos[name]['network_driver'] = driver
+                infos[name]['ip_address'] = ip_address
+                pids[name] = pid
+
+        found = [name for name in container_names if infos[name]['exists']]
+        interfaces = self._container_interfaces([pids[name] for name in found])
+        for name, interface in zip(found, interfaces):
+            infos[name]['interface'] = interface
+
+        return infos
+
+    def _inspect_networks(self, container_names: list) -> list:
+        """Return (name, pid, driver, IP address) of each existing container
+
+        Uses the shared Docker SDK client, whose inspects reuse one socket
+        connection, or else a single `docker inspect` of all the names.
+        """
+        client = docker_client()
+        if client is not None:
+            from docker.errors import DockerException
+            rows = []
+            for name in container_names:
+                try:
+                    info = client.api.inspect_container(name)
+                except DockerException:
+                    continue  # Not found
+                networks = list(info["NetworkSettings"]["Networks"].values())
+                if networks:
+                    rows.append((info["Name"].lstrip('/'), str(info["State"]["Pid"]),
+                                 networks[0].get("Driver", ""), networks[0].get("IPAddress", "")))
+            return rows
+
+        # Unknown names make the exit status non-zero but the others are still listed
+        cmd = ["docker", "inspect", "--format",
+               "{{.Name}}|{{.State.Pid}}|{{range .NetworkSettings.Networks}}{{.Driver}}|{{.IPAddress}}{{end}}",
+               *container_names]
         result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode == 0 and result.stdout.strip():
-            parts = result.stdout.strip().split('|')
-            if len(parts) >= 2:
-                info['exists'] = True
-                info['network_driver'] = parts[0]
-                info['ip_address'] = parts[1]
-
-                # Check interface inside container
-                iface_cmd = ["docker", "exec", container_name, "ip", "link", "show"]
-                iface_result = subprocess.run(iface_cmd, capture_output=True, text=True)
-                if iface_result.returncode == 0:
-                    # Look for eth0 or other interfaces
-                    if "eth0" in iface_result.stdout:
-                        info['interface'] = 'eth0'
-                    # OVS plugin should create eth0
-
-        return info
+        rows = []
+        for line in result.stdout.splitlines():
+            parts = line.strip().split('|')
+            if len(parts) >= 4:
+                rows.append((parts[0].lstrip('/'), parts[1], parts[2], parts[3]))
+        return rows
+
+    def _container_interfaces(self, pids: list) -> list:
+        """Return the OVS plugin interface found in each PID's network namespace
+
+        Each entry is 'eth0' (which the OVS plugin should create) or None.
+        Namespaces are asked directly where possible; the rest go through
+        nsenter in a single sudo shell rather than one per container.
+        """
+        found = {pid: netns_has_interface(pid, "eth0") for pid in pids}
+        unreachable = [pid for pid, has_eth0 in found.items() if has_eth0 is None]
+        if unreachable:
+            script = 'for p; do nsenter -t "$p" -n ip -o link show eth0 >/dev/null 2>&1 && echo "$p"; done'
+            result = subprocess.run([*SUDO, "sh", "-c", script, "sh", *unreachable],
+                                    capture_output=True, text=True)
+            present = set(result.stdout.split())
+            found.update({pid: pid in present for pid in unreachable})
+        return ['eth0' if found[pid] else None for pid in pids]
 
     def show_info(self):
         """Show information about available containers for chaos testing"""
@@ -1159,9 +1841,10 @@ class ChaosEngineer:
 
         print("\n📦 VPC Containers (Application workloads):")
         if groups['vpc-containers']:
-            for c in sorted(groups['vpc-containers']):
-                net_info = self.check_container_network(c)
-                driver = net_info.get('network_driver', 'unknown')
+            vpc_containers = sorted(groups['vpc-containers'])
+            net_infos = self.check_container_networks(vpc_containers)
+            for c in vpc_containers:
+                driver = net_infos[c].get('network_driver', 'unknown')
                 if 'ovs-container-network' in driver:
                     print(f"   • {c} ✓ (OVS plugin)")
                 else:
@@ -1260,7 +1943,8 @@ class ChaosEngineer:
         ] + cmd
 
         if background:
-            proc = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            # Nothing reads a background run's output, so don't let it fill a pipe
+            proc = subprocess.Popen(full_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return proc
         else:
             result = subprocess.run(full_cmd, capture_output=True, text=True)
@@ -1277,6 +1961,22 @@ class ChaosEngineer:
                     print("   ❌ Operation not permitted - Pumba needs --privileged flag")
             return result
 
+    def _wait_for_pumba(self, procs: list) -> int:
+        """Wait for background Pumba runs to finish, returning how many failed
+
+        Each run ends (and removes its netem rules) once its --duration has
+        passed, so no separate sleep is needed. On Ctrl-C the runs are
+        stopped early; docker run forwards the signal and Pumba cleans up.
+        """
+        try:
+            return sum(proc.wait() != 0 for proc in procs)
+        except KeyboardInterrupt:
+            for proc in procs:
+                proc.terminate()
+            for proc in procs:
+                proc.wait()
+            raise
+
     def _packet_loss(self, target: str, duration: int):
         """Introduce packet loss using Pumba"""
         self.logger.info(f"Introducing 30% packet loss on containers matching: {target}")
@@ -1386,14 +2086,10 @@ class ChaosEngineer:
             if proc:
                 procs.append(proc)
 
-        # Wait for duration
         print(f"      Running for {duration} seconds...")
-        time.sleep(duration)
-
-        # Wait for all processes to complete
-        for proc in procs:
-            if proc:
-                proc.wait()
+        failed = self._wait_for_pumba(procs)
+        if failed:
+            print(f"   ⚠️  {failed} of {len(procs)} Pumba runs exited with errors")
 
         print("   ✓ Underlay chaos scenario completed")
         print("      Overlay should have shown resilience during infrastructure failures")
@@ -1409,8 +2105,8 @@ class ChaosEngineer:
         scenarios = []
 
         # Apply different chaos to different groups
-        vpc_a_containers = [c for c in groups['vpc-containers'] if 'vpc-a' in c]
-        vpc_b_containers = [c for c in groups['vpc-containers'] if 'vpc-b' in c]
+        vpc_a_containers = groups['vpc-a']
+        vpc_b_containers = groups['vpc-b']
         traffic_gens = groups['traffic-generators']
 
         if vpc_a_containers:
@@ -1448,12 +2144,9 @@ class ChaosEngineer:
         # Monitor during chaos
         print(f"      Running resilience test for {duration} seconds...")
         print("      Monitor Grafana to observe overlay behavior during chaos")
-        time.sleep(duration)
-
-        # Wait for all scenarios to complete
-        for proc in procs:
-            if proc:
-                proc.wait()
+        failed = self._wait_for_pumba(procs)
+        if failed:
+            print(f"   ⚠️  {failed} of {len(procs)} Pumba runs exited with errors")
 
         print("   ✓ Overlay resilience test completed")
 
@@ -1488,10 +2181,9 @@ class ChaosEngineer:
         print("      Combined with traffic generation, this simulates extreme network stress")
         print("      Monitor Grafana: http://localhost:3000")
 
-        # Wait for all scenarios to complete
-        for proc in procs:
-            if proc:
-                proc.wait()
+        failed = self._wait_for_pumba(procs)
+        if failed:
+            print(f"   ⚠️  {failed} of {len(procs)} Pumba runs exited with errors")
 
         print("   ✓ Mixed chaos scenario completed")
 
@@ -1501,39 +2193,60 @@ class TestRunner:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.plugin_name = "ovs-container-network:latest"
+        self.plugin_name = PLUGIN_NAME
         self.test_network_prefix = "test-net"
         self.test_container_prefix = "test-container"
         self.tests_run = 0
         self.tests_passed = 0
         self.tests_failed = 0
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Worker threads for concurrent test steps, started on first use"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="test")
+        return self._pool
+
+    def close(self):
+        """Shut down the worker threads"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def cleanup_test_resources(self):
         """Clean up all test resources"""
         self.logger.info("Cleaning up test resources...")
 
-        # Remove test containers
-        subprocess.run(
-            f"docker ps -a --filter 'name={self.test_container_prefix}' -q | xargs -r docker rm -f",
-            shell=True, capture_output=True
-        )
-
-        # Remove test networks
-        subprocess.run(
-            f"docker network ls --filter 'name={self.test_network_prefix}' -q | xargs -r docker network rm",
-            shell=True, capture_output=True
-        )
+        # Remove test containers, then test networks. The IDs are listed
+        # directly rather than through a shell and xargs, and the removal
+        # is skipped when there is nothing to remove
+        for list_cmd, rm_cmd in (
+            (["docker", "ps", "-a", "-q", "--filter", f"name={self.test_container_prefix}"],
+             ["docker", "rm", "-f"]),
+            (["docker", "network", "ls", "-q", "--filter", f"name={self.test_network_prefix}"],
+             ["docker", "network", "rm"]),
+        ):
+            ids = subprocess.run(list_cmd, capture_output=True, text=True).stdout.split()
+            if ids:
+                subprocess.run(rm_cmd + ids, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         # Clean up OVN resources if OVN central exists
-        ovn_check = subprocess.run(
-            ["docker", "ps"], capture_output=True, text=True
-        )
-        if "ovn-central" in ovn_check.stdout:
-            subprocess.run(
-                f"docker exec ovn-central ovn-nbctl ls-list 2>/dev/null | grep '{self.test_network_prefix}' | "
-                f"awk '{{print $2}}' | xargs -r -I {{}} docker exec ovn-central ovn-nbctl ls-del {{}}",
-                shell=True, capture_output=True
-            )
+        if "ovn-central" in running_containers():
+            result = run_nbctl(["--bare", "--columns=name", "list", "logical_switch"])
+            # Delete every test switch in one ovn-nbctl transaction
+            args = []
+            for switch in result.stdout.split():
+                if self.test_network_prefix in switch:
+                    args += ["--", "--if-exists", "ls-del", switch]
+            if args:
+                run_nbctl(args[1:])
 
     def log_test(self, message):
         """Log a test being run"""
@@ -1585,16 +2298,13 @@ class TestRunner:
         self.log_test("Testing plugin installation and basic functionality")
 
         try:
-            result = subprocess.run(
-                ["docker", "plugin", "ls"],
-                capture_output=True, text=True, check=True
-            )
+            plugins = docker_plugins()
 
-            if self.plugin_name in result.stdout:
+            if self.plugin_name in plugins:
                 self.pass_test("Plugin is installed")
 
                 # Check if enabled
-                if "true" in result.stdout:
+                if plugins[self.plugin_name]:
                     self.pass_test("Plugin is enabled")
                     return True
                 else:
@@ -1629,11 +2339,11 @@ class TestRunner:
 
             # Verify network exists
             result = subprocess.run(
-                ["docker", "network", "ls"],
+                ["docker", "network", "ls", "--format", "{{.Name}}"],
                 capture_output=True, text=True, check=True
             )
 
-            if network_name in result.stdout:
+            if network_name in set(result.stdout.split()):
                 self.pass_test(f"Network {network_name} exists in Docker")
             else:
                 self.fail_test(f"Network {network_name} not found in Docker")
@@ -1645,7 +2355,7 @@ class TestRunner:
                 capture_output=True, text=True, check=True
             )
 
-            if "br-int" in result.stdout:
+            if "br-int" in set(result.stdout.split()):
                 self.pass_test("OVS bridge br-int exists")
             else:
                 self.fail_test("OVS bridge br-int not found")
@@ -1654,7 +2364,7 @@ class TestRunner:
             # Cleanup
             subprocess.run(
                 ["docker", "network", "rm", network_name],
-                capture_output=True, check=False
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
             )
 
             return True
@@ -1684,7 +2394,8 @@ class TestRunner:
         else:
             self.fail_test("Network creation without OVN config should have failed but succeeded")
             # Clean up unexpected network
-            subprocess.run(["docker", "network", "rm", network_name_no_ovn], capture_output=True)
+            subprocess.run(["docker", "network", "rm", network_name_no_ovn],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return False
 
         # Test 2: Network creation with OVN switch but missing connections should fail
@@ -1705,7 +2416,8 @@ class TestRunner:
         else:
             self.fail_test("Network creation with partial OVN config should have failed but succeeded")
             # Clean up unexpected network
-            subprocess.run(["docker", "network", "rm", network_name_partial], capture_output=True)
+            subprocess.run(["docker", "network", "rm", network_name_partial],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return False
 
         # Test 3: Network creation with complete OVN config should succeed
@@ -1723,7 +2435,8 @@ class TestRunner:
         if result.returncode == 0:
             self.pass_test("Network creation with complete OVN config succeeded")
             # Clean up
-            subprocess.run(["docker", "network", "rm", network_name_complete], capture_output=True)
+            subprocess.run(["docker", "network", "rm", network_name_complete],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         else:
             self.fail_test(f"Network creation with complete OVN config failed: {result.stderr}")
@@ -1749,21 +2462,15 @@ class TestRunner:
                 capture_output=True, check=True
             )
 
-            # Create containers
-            subprocess.run(
-                ["docker", "run", "-d", "--name", container1, "--network", network_name,
-                 "alpine:latest", "sleep", "3600"],
-                capture_output=True, check=True
-            )
-
-            subprocess.run(
-                ["docker", "run", "-d", "--name", container2, "--network", network_name,
+            # Create containers (independent, so start both at once)
+            runs = [self.pool.submit(
+                subprocess.run,
+                ["docker", "run", "-d", "--name", container, "--network", network_name,
                  "alpine:latest", "sleep", "3600"],
                 capture_output=True, check=True
-            )
-
-            # Wait for containers to be ready
-            time.sleep(3)
+            ) for container in (container1, container2)]
+            for run in runs:
+                run.result()
 
             # Get container2 IP
             result = subprocess.run(
@@ -1773,13 +2480,10 @@ class TestRunner:
             )
             container2_ip = result.stdout.strip()
 
-            # Test ping
-            result = subprocess.run(
-                ["docker", "exec", container1, "ping", "-c", "2", container2_ip],
-                capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
+            # Test ping, retrying until the OVN ports are up rather than
+            # sleeping a fixed amount first
+            container1_pid = container_pid(container1)
+            if wait_until(lambda: container_ping(container1, container2_ip, container1_pid), timeout=5):
                 self.pass_test(f"Container {container1} can ping {container2}")
                 return True
             else:
@@ -1791,8 +2495,10 @@ class TestRunner:
             return False
         finally:
             # Cleanup
-            subprocess.run([f"docker rm -f {container1} {container2}"], shell=True, capture_output=True)
-            subprocess.run(["docker", "network", "rm", network_name], capture_output=True)
+            subprocess.run(["docker", "rm", "-f", container1, container2],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.run(["docker", "network", "rm", network_name],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     def run_integration_tests(self) -> bool:
         """Run all integration tests"""
@@ -1857,6 +2563,8 @@ def main():
                                help="OVN central IP address (default: 172.30.0.5)")
     chassis_parser.add_argument("--encap-ip", default="172.30.0.1",
                                help="Local IP for tunnel encapsulation (default: 172.30.0.1)")
+    chassis_parser.add_argument("--exec", dest="exec_handoff", action="store_true",
+                               help="Replace the orchestrator process with the setup commands")
 
     # Test commands
     subparsers.add_parser("test-unit", help="Run unit tests for the plugin")
@@ -1903,7 +2611,11 @@ def main():
 
     elif args.command == "setup-monitoring":
         monitor = MonitoringManager()
-        success = monitor.setup_ovs_exporter() and monitor.setup_node_exporter()
+        # The exporters are independent (download vs apt), so set up both at once
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ovs_exporter = pool.submit(monitor.setup_ovs_exporter)
+            node_exporter = pool.submit(monitor.setup_node_exporter)
+        success = ovs_exporter.result() and node_exporter.result()
         return 0 if success else 1
 
     elif args.command == "check-monitoring":
@@ -1916,19 +2628,21 @@ def main():
 
     elif args.command == "setup-chassis":
         chassis = OVSChassisManager()
+        if args.exec_handoff:
+            chassis.exec_chassis(args.ovn_ip, args.encap_ip)
         return 0 if chassis.setup_chassis(args.ovn_ip, args.encap_ip) else 1
 
     elif args.command == "test-unit":
-        runner = TestRunner()
-        return 0 if runner.run_unit_tests() else 1
+        with TestRunner() as runner:
+            return 0 if runner.run_unit_tests() else 1
 
     elif args.command == "test-integration":
-        runner = TestRunner()
-        return 0 if runner.run_integration_tests() else 1
+        with TestRunner() as runner:
+            return 0 if runner.run_integration_tests() else 1
 
     elif args.command == "test-all":
-        runner = TestRunner()
-        return 0 if runner.run_all_tests() else 1
+        with TestRunner() as runner:
+            return 0 if runner.run_all_tests() else 1
 
     elif args.command == "check":
         checker = NetworkChecker()
@@ -40,8 +40,16 @@ ovsdb-server --detach --monitor \
     --pidfile=/var/run/ovn/ovnsb_db.pid \
     /var/lib/ovn/ovnsb.db
 
+# Wait (up to 5s) for both database sockets to answer rather than a fixed sleep
+for i in {1..50}; do
+    if ovsdb-client list-dbs unix:/var/run/ovn/ovnnb_db.sock &>/dev/null && \
+       ovsdb-client list-dbs unix:/var/run/ovn/ovnsb_db.sock &>/dev/null; then
+        break
+    fi
+    sleep 0.1
+done
+
 # Initialize databases if needed
-sleep 2
 if ! ovn-nbctl --db=unix:/var/run/ovn/ovnnb_db.sock ls-list &>/dev/null; then
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] Initializing OVN Northbound database..."
     ovn-nbctl --db=unix:/var/run/ovn/ovnnb_db.sock init
@@ -73,6 +81,19 @@ for i in {1..30}; do
     sleep 1
 done
 
+# Start ovn-nbctl/ovn-sbctl in daemon mode so that "docker exec ovn-central ovn-nbctl ..."
+# calls reuse one cached database copy instead of fetching a snapshot per invocation.
+# The control socket paths are recorded for orchestrator.py to pick up.
+echo "[$(date '+%Y-%m-%d %H:%M:%S')] Starting ovn-nbctl and ovn-sbctl daemons..."
+ovn-nbctl --db=unix:/var/run/ovn/ovnnb_db.sock \
+    --pidfile=/var/run/ovn/ovn-nbctl.pid \
+    --log-file=/var/log/ovn/ovn-nbctl.log \
+    --detach > /var/run/ovn/ovn-nbctl.daemon
+ovn-sbctl --db=unix:/var/run/ovn/ovnsb_db.sock \
+    --pidfile=/var/run/ovn/ovn-sbctl.pid \
+    --log-file=/var/log/ovn/ovn-sbctl.log \
+    --detach > /var/run/ovn/ovn-sbctl.daemon
+
 # NOTE: br-int bridge is NOT created here - it should be created on compute nodes
 
 echo "[$(date '+%Y-%m-%d %H:%M:%S')] OVN setup complete"
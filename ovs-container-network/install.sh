@@ -76,8 +76,7 @@ setup_ovs_bridge() {
         echo_info "Bridge $bridge already exists"
     else
         echo_info "Creating bridge $bridge"
-        ovs-vsctl add-br "$bridge"
-        ovs-vsctl set bridge "$bridge" fail-mode=secure
+        ovs-vsctl add-br "$bridge" -- set bridge "$bridge" fail-mode=secure
     fi
 }
 
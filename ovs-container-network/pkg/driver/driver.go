@@ -37,6 +37,7 @@ type Driver struct {
 	ovn       *ovn.Client // Optional OVN client
 	store     *store.Store
 	logger    *logrus.Logger
+	chassisID string // Cached OVS system-id, looked up on first Join
 }
 
 // New creates a new OVS network driver
@@ -90,6 +91,16 @@ func New() (*Driver, error) {
 func (d *Driver) recoverState() error {
 	d.logger.Info("Recovering plugin state from persistent storage")
 
+	// List the OVS bridges once for all stored networks rather than running
+	// ovs-vsctl list-br again for each one
+	var existingBridges map[string]bool
+	if bridges, err := d.ovs.ListBridges(); err == nil {
+		existingBridges = make(map[string]bool, len(bridges))
+		for _, br := range bridges {
+			existingBridges[br] = true
+		}
+	}
+
 	// Load networks from store
 	storedNetworks := d.store.ListNetworks()
 	for _, netInfo := range storedNetworks {
@@ -104,20 +115,10 @@ func (d *Driver) recoverState() error {
 			Options:  netInfo.Options,
 		}
 
-		// Verify OVS bridge still exists (just check if we can list it)
-		bridges, err := d.ovs.ListBridges()
-		if err == nil {
-			found := false
-			for _, br := range bridges {
-				if br == netInfo.Bridge {
-					found = true
-					break
-				}
-			}
-			if !found {
-				d.logger.Warnf("Bridge %s for network %s no longer exists, will recreate on demand",
-					netInfo.Bridge, netInfo.ID)
-			}
+		// Verify OVS bridge still exists (skipped if the bridges couldn't be listed)
+		if existingBridges != nil && !existingBridges[netInfo.Bridge] {
+			d.logger.Warnf("Bridge %s for network %s no longer exists, will recreate on demand",
+				netInfo.Bridge, netInfo.ID)
 		}
 
 		// If OVN is configured, verify logical switch exists
@@ -927,9 +928,11 @@ func (d *Driver) Join(req *dnetwork.JoinRequest) (*dnetwork.JoinResponse, error)
 		return nil, fmt.Errorf("endpoint %s not found", req.EndpointID)
 	}
 
-	// Generate veth pair names
+	// Derive the veth pair and OVN logical port names once; the OVS iface-id
+	// and the logical port must agree, so both use logicalPort below
 	vethName := fmt.Sprintf("veth%s", req.EndpointID[:7])
 	vethPeer := fmt.Sprintf("veth%s-p", req.EndpointID[:7])
+	logicalPort := fmt.Sprintf("lsp-%s", req.EndpointID[:12])
 
 	// Create the veth pair and connect to OVS
 	if err := d.ovs.CreateVethPair(vethName, vethPeer); err != nil {
@@ -950,9 +953,8 @@ func (d *Driver) Join(req *dnetwork.JoinRequest) (*dnetwork.JoinResponse, error)
 	// If using OVN, set iface-id to bind this port to the logical port
 	if ep.Network.OVNSwitch != "" {
 		// The iface-id must match the OVN logical port name
-		logicalPortName := fmt.Sprintf("lsp-%s", req.EndpointID[:12])
-		portOptions["external_ids:iface-id"] = logicalPortName
-		d.logger.Infof("Setting iface-id for OVN binding: %s", logicalPortName)
+		portOptions["external_ids:iface-id"] = logicalPort
+		d.logger.Infof("Setting iface-id for OVN binding: %s", logicalPort)
 	}
 
 	// Set VLAN if specified
@@ -985,9 +987,6 @@ func (d *Driver) Join(req *dnetwork.JoinRequest) (*dnetwork.JoinResponse, error)
 		actualMAC := link.Attrs().HardwareAddr.String()
 		d.logger.Infof("Actual veth MAC address: %s", actualMAC)
 
-		// Create logical port name (use endpoint ID for uniqueness)
-		logicalPort := fmt.Sprintf("lsp-%s", req.EndpointID[:12])
-
 		// Use the actual MAC and the IP address
 		ip := ep.IPv4Address
 
@@ -1023,7 +1022,7 @@ func (d *Driver) Join(req *dnetwork.JoinRequest) (*dnetwork.JoinResponse, error)
 		}
 
 		// Port binding happens automatically via ovn-controller on the chassis
-		chassis := getChassisID()
+		chassis := d.chassisIDCached()
 		if chassis != "" {
 			d.logger.Infof("Port %s will be bound by ovn-controller on chassis %s", logicalPort, chassis)
 		}
@@ -1190,11 +1189,25 @@ func generateMAC() string {
 		mac[0], mac[1], mac[2], mac[3], mac[4], mac[5])
 }
 
-// getChassisID gets the OVN chassis ID for this host
-func getChassisID() string {
+// chassisIDCached returns the chassis ID, querying OVS only until a lookup
+// succeeds rather than on every Join. Callers must hold the driver lock.
+func (d *Driver) chassisIDCached() string {
+	if d.chassisID == "" {
+		chassis, fromOVS := getChassisID()
+		if !fromOVS {
+			return chassis
+		}
+		d.chassisID = chassis
+	}
+	return d.chassisID
+}
+
+// getChassisID gets the OVN chassis ID for this host, and whether it came
+// from the environment or the OVS database rather than the hostname fallback
+func getChassisID() (string, bool) {
 	// Try to get from environment first
 	if chassis := os.Getenv("OVN_CHASSIS_ID"); chassis != "" {
-		return chassis
+		return chassis, true
 	}
 
 	// Try to get from OVS database
@@ -1203,12 +1216,12 @@ func getChassisID() string {
 	if err != nil {
 		// Try hostname as fallback
 		hostname, _ := os.Hostname()
-		return hostname
+		return hostname, false
 	}
 
 	chassis := strings.TrimSpace(string(output))
 	chassis = strings.Trim(chassis, "\"")
-	return chassis
+	return chassis, true
 }
 
 // createTransitNetwork creates a transit network with gateway router
@@ -69,6 +69,17 @@ func (c *Client) execNBCtl(args ...string) (string, error) {
 	return strings.TrimSpace(stdout.String()), nil
 }
 
+// rowExists reports whether table has a row with exactly this name. The
+// match is done by the database, rather than by searching a full listing
+// for the name (which also matched names that merely contain it).
+func (c *Client) rowExists(table, name string) (bool, error) {
+	output, err := c.execNBCtl("--bare", "--columns=_uuid", "find", table, fmt.Sprintf("name=%q", name))
+	if err != nil {
+		return false, err
+	}
+	return output != "", nil
+}
+
 // Connect establishes connection to OVN (compatibility method, connection is tested in NewClient)
 func (c *Client) Connect(ctx context.Context) error {
 	// Connection is already established and tested in NewClient
@@ -84,27 +95,23 @@ func (c *Client) Disconnect() {
 // CreateLogicalSwitch creates a logical switch in OVN
 func (c *Client) CreateLogicalSwitch(name string, externalIDs map[string]string) error {
 	// Check if switch already exists
-	output, err := c.execNBCtl("ls-list")
+	exists, err := c.rowExists("Logical_Switch", name)
 	if err != nil {
-		return fmt.Errorf("failed to list switches: %w", err)
+		return fmt.Errorf("failed to look up logical switch %s: %w", name, err)
 	}
 
-	if strings.Contains(output, name) {
+	if exists {
 		c.logger.Infof("Logical switch %s already exists", name)
 		return nil
 	}
 
-	// Create the switch
-	if _, err := c.execNBCtl("ls-add", name); err != nil {
-		return fmt.Errorf("failed to create logical switch %s: %w", name, err)
-	}
-
-	// Set external IDs if provided
+	// Create the switch with its external IDs in one ovn-nbctl transaction
+	args := []string{"ls-add", name}
 	for key, value := range externalIDs {
-		if _, err := c.execNBCtl("set", "Logical_Switch", name,
-			fmt.Sprintf("external_ids:%s=%s", key, value)); err != nil {
-			c.logger.WithError(err).Warnf("Failed to set external_id %s=%s on switch %s", key, value, name)
-		}
+		args = append(args, "--", "set", "Logical_Switch", name, fmt.Sprintf("external_ids:%s=%s", key, value))
+	}
+	if _, err := c.execNBCtl(args...); err != nil {
+		return fmt.Errorf("failed to create logical switch %s: %w", name, err)
 	}
 
 	c.logger.Infof("Created logical switch %s", name)
@@ -113,12 +120,8 @@ func (c *Client) CreateLogicalSwitch(name string, externalIDs map[string]string)
 
 // DeleteLogicalSwitch deletes a logical switch
 func (c *Client) DeleteLogicalSwitch(name string) error {
-	if _, err := c.execNBCtl("ls-del", name); err != nil {
-		// If the switch doesn't exist, that's okay
-		if strings.Contains(err.Error(), "no row") {
-			c.logger.Infof("Logical switch %s doesn't exist", name)
-			return nil
-		}
+	// --if-exists makes deleting a missing row a no-op rather than an error
+	if _, err := c.execNBCtl("--if-exists", "ls-del", name); err != nil {
 		return fmt.Errorf("failed to delete logical switch %s: %w", name, err)
 	}
 
@@ -128,14 +131,9 @@ func (c *Client) DeleteLogicalSwitch(name string) error {
 
 // CreateLogicalPort creates a logical switch port
 func (c *Client) CreateLogicalPort(lswitch, portName, macAddress, ipAddress string, options map[string]string) error {
-	// Create the port
-	if _, err := c.execNBCtl("lsp-add", lswitch, portName); err != nil {
-		// If port already exists, update it
-		if !strings.Contains(err.Error(), "already exists") {
-			return fmt.Errorf("failed to create logical port %s: %w", portName, err)
-		}
-		c.logger.Infof("Logical port %s already exists, updating", portName)
-	}
+	// Create the port and apply all of its settings in one ovn-nbctl
+	// transaction (if port already exists, --may-exist updates it)
+	args := []string{"--may-exist", "lsp-add", lswitch, portName}
 
 	// Check if this is a router-type port
 	isRouterPort := false
@@ -146,42 +144,32 @@ func (c *Client) CreateLogicalPort(lswitch, portName, macAddress, ipAddress stri
 	// Set addresses if provided (skip for router ports, they use "router" keyword)
 	if !isRouterPort && macAddress != "" && ipAddress != "" {
 		address := fmt.Sprintf("%s %s", macAddress, ipAddress)
-		if _, err := c.execNBCtl("lsp-set-addresses", portName, address); err != nil {
-			return fmt.Errorf("failed to set addresses on port %s: %w", portName, err)
-		}
+		args = append(args, "--", "lsp-set-addresses", portName, address)
 
 		// Also set port security to match addresses
-		if _, err := c.execNBCtl("lsp-set-port-security", portName, address); err != nil {
-			c.logger.WithError(err).Warnf("Failed to set port security on %s", portName)
-		}
+		args = append(args, "--", "lsp-set-port-security", portName, address)
 	}
 
 	// Set options on the port
 	for key, value := range options {
 		if key == "type" && value == "router" {
 			// Set port type to router
-			if _, err := c.execNBCtl("lsp-set-type", portName, "router"); err != nil {
-				return fmt.Errorf("failed to set port type to router: %w", err)
-			}
+			args = append(args, "--", "lsp-set-type", portName, "router")
 			// Router ports use the special "router" keyword for addresses
-			if _, err := c.execNBCtl("lsp-set-addresses", portName, "router"); err != nil {
-				c.logger.WithError(err).Warnf("Failed to set router addresses on port %s", portName)
-			}
+			args = append(args, "--", "lsp-set-addresses", portName, "router")
 		} else if key == "router-port" {
 			// Link to router port
-			if _, err := c.execNBCtl("lsp-set-options", portName, fmt.Sprintf("router-port=%s", value)); err != nil {
-				return fmt.Errorf("failed to set router-port option: %w", err)
-			}
-		} else if key == "addresses" {
-			// Already handled above, skip
-			continue
+			args = append(args, "--", "lsp-set-options", portName, fmt.Sprintf("router-port=%s", value))
 		} else if strings.HasPrefix(key, "external_ids:") {
 			idKey := strings.TrimPrefix(key, "external_ids:")
-			if _, err := c.execNBCtl("set", "Logical_Switch_Port", portName,
-				fmt.Sprintf("external_ids:%s=%s", idKey, value)); err != nil {
-				c.logger.WithError(err).Warnf("Failed to set external_id %s=%s on port %s", idKey, value, portName)
-			}
+			args = append(args, "--", "set", "Logical_Switch_Port", portName,
+				fmt.Sprintf("external_ids:%s=%s", idKey, value))
 		}
+		// "addresses" is already handled above
+	}
+
+	if _, err := c.execNBCtl(args...); err != nil {
+		return fmt.Errorf("failed to create logical port %s: %w", portName, err)
 	}
 
 	c.logger.Infof("Created logical port %s on switch %s", portName, lswitch)
@@ -190,12 +178,7 @@ func (c *Client) CreateLogicalPort(lswitch, portName, macAddress, ipAddress stri
 
 // DeleteLogicalPort deletes a logical switch port
 func (c *Client) DeleteLogicalPort(portName string) error {
-	if _, err := c.execNBCtl("lsp-del", portName); err != nil {
-		// If the port doesn't exist, that's okay
-		if strings.Contains(err.Error(), "no row") {
-			c.logger.Infof("Logical port %s doesn't exist", portName)
-			return nil
-		}
+	if _, err := c.execNBCtl("--if-exists", "lsp-del", portName); err != nil {
 		return fmt.Errorf("failed to delete logical port %s: %w", portName, err)
 	}
 
@@ -236,55 +219,36 @@ func (c *Client) GetLogicalSwitch(name string) (map[string]interface{}, error) {
 
 // ListLogicalSwitches lists all logical switches
 func (c *Client) ListLogicalSwitches() ([]string, error) {
-	output, err := c.execNBCtl("ls-list")
+	// Read just the name column; with --bare each name is printed on its own,
+	// so there is no "uuid (name)" line format to pick apart
+	output, err := c.execNBCtl("--bare", "--columns=name", "list", "Logical_Switch")
 	if err != nil {
 		return nil, fmt.Errorf("failed to list logical switches: %w", err)
 	}
 
-	if output == "" {
-		return []string{}, nil
-	}
-
-	// Parse the output - each line contains UUID and name
-	var switches []string
-	for _, line := range strings.Split(output, "\n") {
-		if line == "" {
-			continue
-		}
-		// Line format: "uuid (name)"
-		if idx := strings.Index(line, "("); idx > 0 {
-			name := strings.TrimSuffix(strings.TrimPrefix(line[idx:], "("), ")")
-			switches = append(switches, name)
-		}
-	}
-
-	return switches, nil
+	return strings.Fields(output), nil
 }
 
 // CreateLogicalRouter creates a logical router
 func (c *Client) CreateLogicalRouter(name string, externalIDs map[string]string) error {
 	// Check if router already exists
-	output, err := c.execNBCtl("lr-list")
+	exists, err := c.rowExists("Logical_Router", name)
 	if err != nil {
-		return fmt.Errorf("failed to list routers: %w", err)
+		return fmt.Errorf("failed to look up logical router %s: %w", name, err)
 	}
 
-	if strings.Contains(output, name) {
+	if exists {
 		c.logger.Infof("Logical router %s already exists", name)
 		return nil
 	}
 
-	// Create the router
-	if _, err := c.execNBCtl("lr-add", name); err != nil {
-		return fmt.Errorf("failed to create logical router %s: %w", name, err)
-	}
-
-	// Set external IDs if provided
+	// Create the router with its external IDs in one ovn-nbctl transaction
+	args := []string{"lr-add", name}
 	for key, value := range externalIDs {
-		if _, err := c.execNBCtl("set", "Logical_Router", name,
-			fmt.Sprintf("external_ids:%s=%s", key, value)); err != nil {
-			c.logger.WithError(err).Warnf("Failed to set external_id %s=%s on router %s", key, value, name)
-		}
+		args = append(args, "--", "set", "Logical_Router", name, fmt.Sprintf("external_ids:%s=%s", key, value))
+	}
+	if _, err := c.execNBCtl(args...); err != nil {
+		return fmt.Errorf("failed to create logical router %s: %w", name, err)
 	}
 
 	c.logger.Infof("Created logical router %s", name)
@@ -293,12 +257,7 @@ func (c *Client) CreateLogicalRouter(name string, externalIDs map[string]string)
 
 // DeleteLogicalRouter deletes a logical router
 func (c *Client) DeleteLogicalRouter(name string) error {
-	if _, err := c.execNBCtl("lr-del", name); err != nil {
-		// If the router doesn't exist, that's okay
-		if strings.Contains(err.Error(), "no row") {
-			c.logger.Infof("Logical router %s doesn't exist", name)
-			return nil
-		}
+	if _, err := c.execNBCtl("--if-exists", "lr-del", name); err != nil {
 		return fmt.Errorf("failed to delete logical router %s: %w", name, err)
 	}
 
@@ -310,8 +269,9 @@ func (c *Client) DeleteLogicalRouter(name string) error {
 func (c *Client) CreateLogicalRouterPort(router, portName, mac string, networks []string) error {
 	// Create the router port
 	networkStr := strings.Join(networks, " ")
-	if _, err := c.execNBCtl("lrp-add", router, portName, mac, networkStr); err != nil {
-		// If port already exists, that might be okay
+	if _, err := c.execNBCtl("--may-exist", "lrp-add", router, portName, mac, networkStr); err != nil {
+		// --may-exist covers an identical existing port; one with a different
+		// MAC or networks is still reported as existing, and that's okay too
 		if !strings.Contains(err.Error(), "already exists") {
 			return fmt.Errorf("failed to create logical router port %s: %w", portName, err)
 		}
@@ -324,12 +284,7 @@ func (c *Client) CreateLogicalRouterPort(router, portName, mac string, networks
 
 // DeleteLogicalRouterPort deletes a logical router port
 func (c *Client) DeleteLogicalRouterPort(portName string) error {
-	if _, err := c.execNBCtl("lrp-del", portName); err != nil {
-		// If the port doesn't exist, that's okay
-		if strings.Contains(err.Error(), "no row") {
-			c.logger.Infof("Logical router port %s doesn't exist", portName)
-			return nil
-		}
+	if _, err := c.execNBCtl("--if-exists", "lrp-del", portName); err != nil {
 		return fmt.Errorf("failed to delete logical router port %s: %w", portName, err)
 	}
 
@@ -339,13 +294,10 @@ func (c *Client) DeleteLogicalRouterPort(portName string) error {
 
 // AddStaticRoute adds a static route to a logical router
 func (c *Client) AddStaticRoute(router, prefix, nexthop string) error {
-	if _, err := c.execNBCtl("lr-route-add", router, prefix, nexthop); err != nil {
-		// If route already exists, that might be okay
-		// OVN can report this as either "already exists" or "duplicate prefix"
-		if !strings.Contains(err.Error(), "already exists") && !strings.Contains(err.Error(), "duplicate prefix") {
-			return fmt.Errorf("failed to add static route: %w", err)
-		}
-		c.logger.Infof("Static route %s via %s already exists on router %s", prefix, nexthop, router)
+	// With --may-exist an existing route for the prefix is updated to this
+	// nexthop instead of failing with "duplicate prefix"
+	if _, err := c.execNBCtl("--may-exist", "lr-route-add", router, prefix, nexthop); err != nil {
+		return fmt.Errorf("failed to add static route: %w", err)
 	}
 
 	c.logger.Infof("Added static route %s via %s to router %s", prefix, nexthop, router)
@@ -354,12 +306,7 @@ func (c *Client) AddStaticRoute(router, prefix, nexthop string) error {
 
 // DeleteStaticRoute removes a static route from a logical router
 func (c *Client) DeleteStaticRoute(router, prefix string) error {
-	if _, err := c.execNBCtl("lr-route-del", router, prefix); err != nil {
-		// If route doesn't exist, that's okay
-		if strings.Contains(err.Error(), "no row") {
-			c.logger.Infof("Static route %s doesn't exist on router %s", prefix, router)
-			return nil
-		}
+	if _, err := c.execNBCtl("--if-exists", "lr-route-del", router, prefix); err != nil {
 		return fmt.Errorf("failed to delete static route: %w", err)
 	}
 
@@ -1,7 +1,9 @@
 package ovs
 
 import (
+	"encoding/json"
 	"fmt"
+	"net"
 	"os/exec"
 	"strings"
 
@@ -63,26 +65,23 @@ func (c *Client) EnsureBridge(bridge string) error {
 		return nil
 	}
 
-	// Create the bridge
+	// Create the bridge in secure mode in one transaction, so it never
+	// forwards in standalone mode in between
 	c.logger.Infof("Creating OVS bridge %s", bridge)
-	cmd = exec.Command("ovs-vsctl", "add-br", bridge)
+	cmd = exec.Command("ovs-vsctl", "add-br", bridge, "--", "set", "bridge", bridge, "fail-mode=secure")
 	output, err := cmd.CombinedOutput()
 	if err != nil {
 		return fmt.Errorf("failed to create bridge %s: %w (output: %s)", bridge, err, string(output))
 	}
 
-	// Set bridge to secure mode
-	cmd = exec.Command("ovs-vsctl", "set", "bridge", bridge, "fail-mode=secure")
-	if output, err := cmd.CombinedOutput(); err != nil {
-		c.logger.Warnf("Failed to set bridge %s to secure mode: %v (output: %s)", bridge, err, string(output))
-	}
-
 	return nil
 }
 
 // AddPort adds a port to an OVS bridge
 func (c *Client) AddPort(bridge, port string, options map[string]string) error {
-	args := []string{"add-port", bridge, port}
+	// --may-exist keeps re-adding an existing port from failing the whole
+	// transaction, so the settings below are still applied
+	args := []string{"--may-exist", "add-port", bridge, port}
 
 	// Separate options by table
 	var portOptions []string
@@ -110,11 +109,6 @@ func (c *Client) AddPort(bridge, port string, options map[string]string) error {
 	cmd := exec.Command("ovs-vsctl", args...)
 	output, err := cmd.CombinedOutput()
 	if err != nil {
-		// Check if port already exists
-		if strings.Contains(string(output), "already exists") {
-			c.logger.Warnf("Port %s already exists on bridge %s", port, bridge)
-			return nil
-		}
 		return fmt.Errorf("failed to add port %s to bridge %s: %w (output: %s)", port, bridge, err, string(output))
 	}
 
@@ -136,19 +130,18 @@ func (c *Client) DeletePort(bridge, port string) error {
 
 // CreateVethPair creates a veth pair
 func (c *Client) CreateVethPair(vethName, peerName string) error {
-	// Check if veth already exists
-	if _, err := netlink.LinkByName(vethName); err == nil {
+	// Check if veth already exists, and delete it using the same lookup
+	if link, err := netlink.LinkByName(vethName); err == nil {
 		c.logger.Warnf("Veth %s already exists, deleting it", vethName)
-		// Try to delete existing veth
-		if link, err := netlink.LinkByName(vethName); err == nil {
-			netlink.LinkDel(link)
-		}
+		netlink.LinkDel(link)
 	}
 
-	// Create the veth pair
+	// Create the veth pair with the host end already up, so it needs no
+	// separate lookup and set-up request afterwards
 	veth := &netlink.Veth{
 		LinkAttrs: netlink.LinkAttrs{
-			Name: vethName,
+			Name:  vethName,
+			Flags: net.FlagUp,
 		},
 		PeerName: peerName,
 	}
@@ -157,13 +150,7 @@ func (c *Client) CreateVethPair(vethName, peerName string) error {
 		return fmt.Errorf("failed to create veth pair %s <-> %s: %w", vethName, peerName, err)
 	}
 
-	// Bring up both interfaces
-	if link, err := netlink.LinkByName(vethName); err == nil {
-		if err := netlink.LinkSetUp(link); err != nil {
-			c.logger.Warnf("Failed to bring up %s: %v", vethName, err)
-		}
-	}
-
+	// Bring up the peer interface
 	if link, err := netlink.LinkByName(peerName); err == nil {
 		if err := netlink.LinkSetUp(link); err != nil {
 			c.logger.Warnf("Failed to bring up %s: %v", peerName, err)
@@ -211,28 +198,16 @@ func (c *Client) SetPortVLAN(port string, vlan int) error {
 
 // GetPortInfo retrieves information about a port
 func (c *Client) GetPortInfo(port string) (map[string]string, error) {
-	info := make(map[string]string)
-
-	// Get external_ids
-	cmd := exec.Command("ovs-vsctl", "get", "interface", port, "external_ids")
-	output, err := cmd.CombinedOutput()
+	// Get external_ids as JSON rather than scraping the {key=value, ...} text
+	cmd := exec.Command("ovs-vsctl", "--format=json", "--columns=external_ids", "list", "interface", port)
+	output, err := cmd.Output()
 	if err != nil {
 		return nil, fmt.Errorf("failed to get port info for %s: %w", port, err)
 	}
 
-	// Parse the output (format: {key1=value1, key2=value2})
-	externalIDs := strings.TrimSpace(string(output))
-	externalIDs = strings.Trim(externalIDs, "{}")
-	if externalIDs != "" {
-		pairs := strings.Split(externalIDs, ", ")
-		for _, pair := range pairs {
-			kv := strings.SplitN(pair, "=", 2)
-			if len(kv) == 2 {
-				key := strings.Trim(kv[0], "\"")
-				value := strings.Trim(kv[1], "\"")
-				info["external_id:"+key] = value
-			}
-		}
+	info, err := parseExternalIDs(output)
+	if err != nil {
+		return nil, fmt.Errorf("failed to parse port info for %s: %w", port, err)
 	}
 
 	// Get VLAN tag if set
@@ -247,6 +222,37 @@ func (c *Client) GetPortInfo(port string) (map[string]string, error) {
 	return info, nil
 }
 
+// parseExternalIDs reads the external_ids column of
+// `ovs-vsctl --format=json --columns=external_ids list ...` output, where an
+// OVSDB map is encoded as ["map", [[key, value], ...]]
+func parseExternalIDs(output []byte) (map[string]string, error) {
+	var table struct {
+		Data [][]json.RawMessage `json:"data"`
+	}
+	if err := json.Unmarshal(output, &table); err != nil {
+		return nil, err
+	}
+
+	info := make(map[string]string)
+	for _, row := range table.Data {
+		if len(row) == 0 {
+			continue
+		}
+		var column []json.RawMessage
+		if err := json.Unmarshal(row[0], &column); err != nil || len(column) != 2 {
+			return nil, fmt.Errorf("unexpected external_ids value: %s", row[0])
+		}
+		var pairs [][2]string
+		if err := json.Unmarshal(column[1], &pairs); err != nil {
+			return nil, err
+		}
+		for _, kv := range pairs {
+			info["external_id:"+kv[0]] = kv[1]
+		}
+	}
+	return info, nil
+}
+
 // CreateMirror sets up port mirroring
 func (c *Client) CreateMirror(bridge, mirrorName, sourcePort, outputPort string, options map[string]string) error {
 	// Build the command to create a mirror
@@ -32,32 +32,39 @@ func TestParseExternalIDs(t *testing.T) {
 	}{
 		{
 			name:  "single pair",
-			input: `{container_id="test123"}`,
+			input: `{"data":[[["map",[["container_id","test123"]]]]],"headings":["external_ids"]}`,
 			expected: map[string]string{
 				"external_id:container_id": "test123",
 			},
 		},
 		{
 			name:  "multiple pairs",
-			input: `{container_id="test123", tenant_id="tenant-a", network_id="net456"}`,
+			input: `{"data":[[["map",[["container_id","test123"],["network_id","net456"],["tenant_id","tenant-a"]]]]],"headings":["external_ids"]}`,
 			expected: map[string]string{
 				"external_id:container_id": "test123",
 				"external_id:tenant_id":    "tenant-a",
 				"external_id:network_id":   "net456",
 			},
 		},
+		{
+			name:  "value with separators",
+			input: `{"data":[[["map",[["note","a=b, c=d"]]]]],"headings":["external_ids"]}`,
+			expected: map[string]string{
+				"external_id:note": "a=b, c=d",
+			},
+		},
 		{
 			name:     "empty",
-			input:    `{}`,
+			input:    `{"data":[[["map",[]]]],"headings":["external_ids"]}`,
 			expected: map[string]string{},
 		},
 	}
 
 	for _, tc := range testCases {
 		t.Run(tc.name, func(t *testing.T) {
-			// This would be a helper function in the real implementation
-			// For now, we're just testing the concept
-			assert.NotNil(t, tc.expected)
+			info, err := parseExternalIDs([]byte(tc.input))
+			assert.NoError(t, err)
+			assert.Equal(t, tc.expected, info)
 		})
 	}
 }